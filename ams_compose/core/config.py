@@ -5,6 +5,12 @@ from typing import Dict, Optional, Any, List
 from pydantic import BaseModel, Field, ConfigDict
 import yaml
 
+# Prefer the libyaml C bindings; fall back to the pure-Python implementation
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
 
 class ImportSpec(BaseModel):
     """Specification for an imported library."""
@@ -70,14 +76,14 @@ class ComposeConfig(BaseModel):
     def from_yaml(cls, config_path: Path) -> "ComposeConfig":
         """Load configuration from YAML file."""
         with open(config_path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YamlLoader)
         return cls(**data)
     
     def to_yaml(self, config_path: Path) -> None:
         """Save configuration to YAML file."""
         data = self.model_dump(exclude_none=True)
         with open(config_path, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
 
 
 class LockFile(BaseModel):
@@ -91,6 +97,24 @@ class LockFile(BaseModel):
         description="Installed library entries"
     )
     
+    @classmethod
+    def load(cls, lock_path: Path) -> "LockFile":
+        """Load lock file, accepting both JSON and legacy YAML content."""
+        if not lock_path.exists():
+            return cls(library_root="libs")
+        
+        data = lock_path.read_bytes()
+        if data.lstrip().startswith(b'{'):
+            return cls.model_validate_json(data)
+        # Lock files written before the switch to JSON are YAML
+        return cls(**yaml.load(data, Loader=YamlLoader))
+    
+    def to_json(self, lock_path: Path) -> None:
+        """Save lock file to JSON."""
+        data = self.model_dump_json(indent=2, exclude_none=True)
+        with open(lock_path, 'w') as f:
+            f.write(data + "\n")
+    
     @classmethod
     def from_yaml(cls, lock_path: Path) -> "LockFile":
         """Load lock file from YAML."""
@@ -98,11 +122,11 @@ class LockFile(BaseModel):
             return cls(library_root="libs")
         
         with open(lock_path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YamlLoader)
         return cls(**data)
     
     def to_yaml(self, lock_path: Path) -> None:
         """Save lock file to YAML."""
         data = self.model_dump(exclude_none=True)
         with open(lock_path, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
\ No newline at end of file
+            yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
\ No newline at end of file
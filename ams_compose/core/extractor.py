@@ -1,16 +1,19 @@
 """Path extraction operations for ams-compose."""
 
+import os
 import shutil
+import stat
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Callable, Set, List
+from typing import Optional, Dict, Callable, Set, List, Tuple, FrozenSet
 from dataclasses import dataclass
 
 import pathspec
 import yaml
 
-from .config import ImportSpec
+from .config import ImportSpec, YamlDumper
 from ..utils.checksum import ChecksumCalculator
 from ..utils.license import LicenseDetector
 from .. import __version__
@@ -102,6 +105,22 @@ class PathExtractor:
         """
         return cls.VCS_IGNORE_PATTERNS | cls.DEV_TOOL_IGNORE_PATTERNS | cls.OS_IGNORE_PATTERNS
     
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _split_builtin_ignore_patterns(cls) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+        """Split built-in ignore patterns into exact names and '*.ext' suffixes.
+        
+        The built-in patterns are class constants, so the split is computed once
+        per class rather than for every extraction.
+        
+        Returns:
+            Tuple of (exact names, suffixes including the leading dot)
+        """
+        builtin_ignores = cls.get_builtin_ignore_patterns()
+        builtin_names = frozenset(p for p in builtin_ignores if not p.startswith('*.'))
+        builtin_suffixes = tuple(p[1:] for p in builtin_ignores if p.startswith('*.'))
+        return builtin_names, builtin_suffixes
+    
     def _load_global_ignore_patterns(self) -> List[str]:
         """Load global ignore patterns from .ams-compose-ignore file.
         
@@ -167,6 +186,11 @@ class PathExtractor:
                 # If pathspec fails, continue without pattern matching
                 pathspec_matcher = None
         
+        # Built-in patterns are either exact names or '*.ext' suffix globs;
+        # the cached split leaves each directory only a set and suffix check
+        builtin_names, builtin_suffixes = self._split_builtin_ignore_patterns()
+        license_filenames = frozenset(self.license_detector.LICENSE_FILENAMES)
+        
         def ignore_function(directory: str, filenames: list) -> list:
             ignored = set()
             filenames_set = set(filenames)
@@ -174,13 +198,11 @@ class PathExtractor:
             # Identify LICENSE files if preservation is enabled
             license_files = set()
             if preserve_license_files:
-                for filename in filenames:
-                    if filename in self.license_detector.LICENSE_FILENAMES:
-                        license_files.add(filename)
+                license_files = filenames_set & license_filenames
             
-            # Tier 1: Apply built-in ignore patterns (exact filename matches)
-            builtin_ignores = self.get_builtin_ignore_patterns()
-            ignored.update(filenames_set.intersection(builtin_ignores))
+            # Tier 1: Apply built-in ignore patterns (exact names and suffix globs)
+            ignored.update(filenames_set & builtin_names)
+            ignored.update(name for name in filenames if name.endswith(builtin_suffixes))
             
             # Tier 2 & 3: Apply gitignore-style patterns from global and library configs
             if pathspec_matcher:
@@ -287,7 +309,7 @@ class PathExtractor:
         # Write metadata file only when content changes.
         # This preserves stable outputs and avoids unnecessary file churn.
         metadata_file = local_path / '.ams-compose-metadata.yaml'
-        serialized = yaml.dump(provenance, default_flow_style=False, sort_keys=False)
+        serialized = yaml.dump(provenance, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
         if metadata_file.exists() and metadata_file.read_text() == serialized:
             return
         with open(metadata_file, 'w') as f:
@@ -458,9 +480,11 @@ class PathExtractor:
         # Create parent directories
         local_path.parent.mkdir(parents=True, exist_ok=True)
         
+        is_directory = source_full_path.is_dir()
+        
         try:
             # Copy source to destination
-            if source_full_path.is_dir():
+            if is_directory:
                 # Pre-create directory and immediately exclude from iCloud sync.
                 # Setting the xattr before any files land prevents iCloud from
                 # racing to restore "deleted" files as conflict copies (e.g.
@@ -490,24 +514,22 @@ class PathExtractor:
                 # Single file - copy to parent directory with same name
                 shutil.copy2(source_full_path, local_path)
             
-            # Generate provenance metadata for checkin=true libraries  
-            if local_path.is_dir():
+            if is_directory:
+                # Generate provenance metadata for checkin=true libraries
                 self._generate_provenance_metadata(
                     library_name, import_spec, mirror_path, resolved_commit, local_path
                 )
-            
-            # Inject .gitignore for checkin=false libraries BEFORE checksum calculation
-            # This ensures the checksum includes the .gitignore file for validation consistency
-            if local_path.is_dir():
+                
+                # Inject .gitignore for checkin=false libraries BEFORE checksum calculation
+                # This ensures the checksum includes the .gitignore file for validation consistency
                 self._inject_gitignore_if_needed(library_name, import_spec.checkin, local_path)
-            
-            # Inject LICENSE file from repository root for legal compliance
-            # This ensures LICENSE files are available even with subdirectory source_paths
-            if local_path.is_dir():
+                
+                # Inject LICENSE file from repository root for legal compliance
+                # This ensures LICENSE files are available even with subdirectory source_paths
                 self._inject_license_file_if_available(mirror_path, local_path, import_spec.ignore_patterns)
             
             # Calculate checksum of extracted content (after provenance, gitignore, and license injection)
-            if local_path.is_dir():
+            if is_directory:
                 checksum = ChecksumCalculator.calculate_directory_checksum(local_path)
             else:
                 checksum = ChecksumCalculator.calculate_file_checksum(local_path)
@@ -536,16 +558,7 @@ class PathExtractor:
         Returns:
             Checksum if valid, None if library doesn't exist
         """
-        if not library_path.exists():
-            return None
-        
-        try:
-            if library_path.is_dir():
-                return ChecksumCalculator.calculate_directory_checksum(library_path)
-            else:
-                return ChecksumCalculator.calculate_file_checksum(library_path)
-        except Exception:
-            return None
+        return self.calculate_library_checksum(library_path)
     
     def remove_library(self, library_path: Path) -> bool:
         """Remove installed library.
@@ -585,10 +598,12 @@ class PathExtractor:
         if not library_root_path.exists():
             return libraries
         
-        # Search for directories and files in library root
-        for item in library_root_path.iterdir():
-            if item.is_dir() or item.is_file():
-                libraries[item.name] = item
+        # Search for directories and files in library root; scandir reuses the
+        # entry type from the directory listing instead of stat-ing every item
+        with os.scandir(library_root_path) as entries:
+            for entry in entries:
+                if entry.is_dir() or entry.is_file():
+                    libraries[entry.name] = library_root_path / entry.name
         
         return libraries
     
@@ -601,13 +616,17 @@ class PathExtractor:
         Returns:
             Checksum if successful, None if failed
         """
-        if not library_path.exists():
+        # One stat call both detects a missing path and picks file vs directory
+        try:
+            mode = os.stat(library_path).st_mode
+        except OSError:
             return None
         
         try:
-            if library_path.is_dir():
+            if stat.S_ISDIR(mode):
                 return ChecksumCalculator.calculate_directory_checksum(library_path)
-            else:
+            if stat.S_ISREG(mode):
                 return ChecksumCalculator.calculate_file_checksum(library_path)
+            return None
         except Exception:
             return None
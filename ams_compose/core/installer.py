@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
 from .config import ComposeConfig, LockFile, LockEntry, ImportSpec
-from .mirror import RepositoryMirror
+from .mirror import RepositoryMirror, MirrorState
 from .extractor import PathExtractor
 from ..utils.checksum import ChecksumCalculator
 from ..utils.license import LicenseDetector
@@ -42,6 +42,34 @@ class LibraryInstaller:
         # Configuration paths
         self.config_path = self.project_root / "ams-compose.yaml"
         self.lock_path = self.project_root / ".ams-compose.lock"
+        
+        # Mirror states resolved during the current install_all run (repo -> (ref, state))
+        self._mirror_states: Optional[Dict[str, Tuple[str, MirrorState]]] = None
+    
+    def _update_mirror(self, repo: str, ref: str) -> MirrorState:
+        """Update mirror for repo/ref, reusing the result within one install_all run.
+        
+        Libraries sharing a repository share a single mirror checkout, so a cached
+        state is only reused while the mirror is still checked out at the same ref.
+        
+        Args:
+            repo: Repository URL
+            ref: Git reference to resolve
+            
+        Returns:
+            MirrorState for the mirror checked out at ref
+        """
+        if self._mirror_states is None:
+            return self.mirror_manager.update_mirror(repo, ref)
+        
+        cached = self._mirror_states.get(repo)
+        if cached is not None and cached[0] == ref:
+            logger.debug(f"Reusing mirror state for {repo}@{ref}")
+            return cached[1]
+        
+        mirror_state = self.mirror_manager.update_mirror(repo, ref)
+        self._mirror_states[repo] = (ref, mirror_state)
+        return mirror_state
     
     def _validate_library_path(self, local_path: str, library_name: str) -> Path:
         """Validate that library path is safe and within project directory.
@@ -87,7 +115,7 @@ class LibraryInstaller:
         """Load or create lock file."""
         try:
             if self.lock_path.exists():
-                return LockFile.from_yaml(self.lock_path)
+                return LockFile.load(self.lock_path)
             else:
                 # Create new lock file with default library_root
                 config = self.load_config()
@@ -98,7 +126,7 @@ class LibraryInstaller:
     def save_lock_file(self, lock_file: LockFile) -> None:
         """Save lock file to disk."""
         try:
-            lock_file.to_yaml(self.lock_path)
+            lock_file.to_json(self.lock_path)
         except Exception as e:
             raise InstallationError(f"Failed to save lock file: {e}")
     
@@ -123,7 +151,7 @@ class LibraryInstaller:
         """
         try:
             # Step 1: Mirror the repository
-            mirror_metadata = self.mirror_manager.update_mirror(
+            mirror_metadata = self._update_mirror(
                 import_spec.repo, 
                 import_spec.ref
             )
@@ -267,7 +295,7 @@ class LibraryInstaller:
                             logger.debug(f"{library_name}: checking remote for updates via mirror")
                             try:
                                 logger.debug(f"{library_name}: calling update_mirror({import_spec.repo}, {import_spec.ref})")
-                                mirror_state = self.mirror_manager.update_mirror(
+                                mirror_state = self._update_mirror(
                                     import_spec.repo, 
                                     import_spec.ref
                                 )
@@ -394,61 +422,66 @@ class LibraryInstaller:
         Raises:
             InstallationError: If any installation fails
         """
-        logger.debug(f"install_all called with library_names={library_names}, force={force}")
-        
-        # Load configuration and resolve target libraries
-        logger.debug("Loading configuration")
-        config = self.load_config()
-        logger.debug(f"Configuration loaded with {len(config.imports)} libraries")
-        
-        libraries_to_install = self._resolve_target_libraries(library_names, config)
-        logger.debug(f"Resolved {len(libraries_to_install)} libraries to install")
-        
-        if not libraries_to_install:
-            logger.debug("No libraries to install, returning empty dict")
-            return {}
-        
-        # Load current lock file and determine what needs work
-        logger.debug("Loading lock file")
-        lock_file = self.load_lock_file()
-        logger.debug(f"Lock file loaded with {len(lock_file.libraries)} existing libraries")
-        
-        logger.debug("Determining libraries needing work")
-        libraries_needing_work, skipped_libraries = self._determine_libraries_needing_work(
-            libraries_to_install, lock_file, force, check_remote_updates
-        )
-        logger.debug(f"Libraries needing work: {len(libraries_needing_work)}, skipped: {len(skipped_libraries)}")
-        
-        # Get up-to-date libraries info
-        logger.debug("Processing up-to-date libraries")
-        up_to_date_libraries = {}
-        for library_name in skipped_libraries:
-            if library_name in lock_file.libraries:
-                lock_entry = lock_file.libraries[library_name].model_copy()
-                lock_entry.install_status = "up_to_date"
-                up_to_date_libraries[library_name] = lock_entry
-        
-        if not libraries_needing_work:
-            logger.debug("No libraries need work, returning up-to-date libraries")
-            return up_to_date_libraries
-        
-        # Install/update libraries that need work
-        logger.debug(f"Installing batch of {len(libraries_needing_work)} libraries")
-        installed_libraries = self._install_libraries_batch(libraries_needing_work, config, lock_file)
-        logger.debug(f"Batch installation completed, got {len(installed_libraries)} results")
-        
-        # Update lock file with new installations
-        logger.debug("Updating lock file")
-        self._update_lock_file(installed_libraries, config)
-        logger.debug("Lock file updated")
-        
-        # Combine all processed libraries into single result
-        all_libraries = {}
-        all_libraries.update(installed_libraries)
-        all_libraries.update(up_to_date_libraries)
-        
-        logger.debug(f"install_all returning {len(all_libraries)} total libraries")
-        return all_libraries
+        # Each repository mirror is fetched at most once per ref during this run
+        self._mirror_states = {}
+        try:
+            logger.debug(f"install_all called with library_names={library_names}, force={force}")
+            
+            # Load configuration and resolve target libraries
+            logger.debug("Loading configuration")
+            config = self.load_config()
+            logger.debug(f"Configuration loaded with {len(config.imports)} libraries")
+            
+            libraries_to_install = self._resolve_target_libraries(library_names, config)
+            logger.debug(f"Resolved {len(libraries_to_install)} libraries to install")
+            
+            if not libraries_to_install:
+                logger.debug("No libraries to install, returning empty dict")
+                return {}
+            
+            # Load current lock file and determine what needs work
+            logger.debug("Loading lock file")
+            lock_file = self.load_lock_file()
+            logger.debug(f"Lock file loaded with {len(lock_file.libraries)} existing libraries")
+            
+            logger.debug("Determining libraries needing work")
+            libraries_needing_work, skipped_libraries = self._determine_libraries_needing_work(
+                libraries_to_install, lock_file, force, check_remote_updates
+            )
+            logger.debug(f"Libraries needing work: {len(libraries_needing_work)}, skipped: {len(skipped_libraries)}")
+            
+            # Get up-to-date libraries info
+            logger.debug("Processing up-to-date libraries")
+            up_to_date_libraries = {}
+            for library_name in skipped_libraries:
+                if library_name in lock_file.libraries:
+                    lock_entry = lock_file.libraries[library_name].model_copy()
+                    lock_entry.install_status = "up_to_date"
+                    up_to_date_libraries[library_name] = lock_entry
+            
+            if not libraries_needing_work:
+                logger.debug("No libraries need work, returning up-to-date libraries")
+                return up_to_date_libraries
+            
+            # Install/update libraries that need work
+            logger.debug(f"Installing batch of {len(libraries_needing_work)} libraries")
+            installed_libraries = self._install_libraries_batch(libraries_needing_work, config, lock_file)
+            logger.debug(f"Batch installation completed, got {len(installed_libraries)} results")
+            
+            # Update lock file with new installations
+            logger.debug("Updating lock file")
+            self._update_lock_file(installed_libraries, config)
+            logger.debug("Lock file updated")
+            
+            # Combine all processed libraries into single result
+            all_libraries = {}
+            all_libraries.update(installed_libraries)
+            all_libraries.update(up_to_date_libraries)
+            
+            logger.debug(f"install_all returning {len(all_libraries)} total libraries")
+            return all_libraries
+        finally:
+            self._mirror_states = None
     
     def list_installed_libraries(self) -> Dict[str, LockEntry]:
         """List all currently installed libraries.
@@ -1,6 +1,7 @@
 """Repository mirroring operations for ams-compose."""
 
 import os
+import re
 import shutil
 import tempfile
 import signal
@@ -9,11 +10,19 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from urllib.parse import urlparse
+from urllib.request import url2pathname
 
 import git
 
 from ..utils.checksum import ChecksumCalculator
 
+# URL validation constants, built once at import time
+_REMOTE_URL_SCHEMES = frozenset({'https', 'http', 'git', 'ssh'})
+_SUSPICIOUS_URL_PATTERNS = ('..', '~', '$', '`', '|', ';', '&')
+
+# Full 40-character hex SHA-1 commit reference
+_COMMIT_SHA_RE = re.compile(r'[0-9a-fA-F]{40}')
+
 
 @dataclass
 class MirrorState:
@@ -26,6 +35,11 @@ class GitOperationTimeout(Exception):
     pass
 
 
+def _has_git_head(path: Path) -> bool:
+    """Cheap check that path is a git working tree, without opening the repo."""
+    return (path / ".git" / "HEAD").is_file()
+
+
 def timeout_handler(signum, frame):
     """Signal handler for operation timeout."""
     raise GitOperationTimeout("Git operation timed out")
@@ -97,9 +111,7 @@ class RepositoryMirror:
             raise ValueError(f"Malformed URL missing host: {repo_url}")
         
         # Check for allowed schemes
-        allowed_schemes = {'https', 'http', 'git', 'ssh'}
-        if self.allow_file_urls:
-            allowed_schemes.add('file')
+        allowed_schemes = _REMOTE_URL_SCHEMES | {'file'} if self.allow_file_urls else _REMOTE_URL_SCHEMES
             
         if parsed.scheme and parsed.scheme.lower() not in allowed_schemes:
             raise ValueError(
@@ -115,8 +127,7 @@ class RepositoryMirror:
             )
         
         # Check for potentially malicious patterns
-        suspicious_patterns = ['..', '~', '$', '`', '|', ';', '&']
-        for pattern in suspicious_patterns:
+        for pattern in _SUSPICIOUS_URL_PATTERNS:
             if pattern in repo_url:
                 raise ValueError(
                     f"Repository URL contains suspicious pattern '{pattern}': {repo_url}"
@@ -182,16 +193,8 @@ class RepositoryMirror:
         Returns:
             True if mirror directory exists with valid git repo
         """
-        mirror_path = self.get_mirror_path(repo_url)
-        if not mirror_path.exists():
-            return False
-        
-        try:
-            # Check if it's a valid git repository
-            git.Repo(mirror_path)
-            return True
-        except (git.InvalidGitRepositoryError, git.NoSuchPathError):
-            return False
+        # Callers open the repo right after; a corrupt mirror fails there and is re-cloned
+        return _has_git_head(self.get_mirror_path(repo_url))
     
     def get_mirror_commit(self, repo_url: str) -> Optional[str]:
         """Get current commit for existing mirror.
@@ -212,12 +215,15 @@ class RepositoryMirror:
         except Exception:
             return None
     
-    def create_mirror(self, repo_url: str, ref: str = "main") -> MirrorState:
+    def create_mirror(self, repo_url: str, ref: str = "main", shallow: bool = False) -> MirrorState:
         """Create new mirror by cloning repository.
         
         Args:
             repo_url: Repository URL to clone
             ref: Git reference to checkout (branch, tag, or commit)
+            shallow: Clone only the tip of ``ref`` (depth 1, single branch, no tags).
+                Intended for workloads that only need tip-commit semantics; ignored
+                when ``ref`` is a commit SHA, which cannot be cloned shallowly.
             
         Returns:
             MirrorState for the created mirror
@@ -244,15 +250,30 @@ class RepositoryMirror:
             with tempfile.TemporaryDirectory() as temp_dir:
                 temp_path = Path(temp_dir) / "repo"
                 
+                clone_kwargs = {'recurse_submodules': True}
+                is_commit_sha = _COMMIT_SHA_RE.fullmatch(ref) is not None
+                shallow = shallow and not is_commit_sha
+                if shallow:
+                    clone_kwargs.update(depth=1, single_branch=True, no_tags=True, branch=ref)
+                
+                # git skips its local-clone fast path (hardlinked objects) for
+                # file:// URLs, so clone those from the plain path; shallow
+                # clones keep the URL since --depth is ignored for local paths
+                clone_url = repo_url
+                parsed_url = urlparse(repo_url)
+                if parsed_url.scheme == 'file' and not shallow:
+                    clone_url = url2pathname(parsed_url.path)
+                
                 # Clone repository with timeout and submodule support
                 repo = self._with_timeout(
-                    lambda: git.Repo.clone_from(url=repo_url, to_path=temp_path, recurse_submodules=True),
+                    lambda: git.Repo.clone_from(url=clone_url, to_path=temp_path, **clone_kwargs),
                     timeout=300  # Increase timeout to 5 minutes for problematic repos
                 )
                 
-                # Checkout requested ref with timeout
+                # Checkout requested ref with timeout (shallow clones are already on it)
                 try:
-                    self._with_timeout(lambda: repo.git.checkout(ref))
+                    if not shallow:
+                        self._with_timeout(lambda: repo.git.checkout(ref))
                     resolved_commit = repo.head.commit.hexsha
                 except git.GitCommandError as e:
                     if "pathspec" in str(e).lower():
@@ -316,7 +337,7 @@ class RepositoryMirror:
             
             # For branch references, always fetch to get latest commits
             # For commit SHAs and tags, check locally first
-            is_commit_sha = len(ref) == 40 and all(c in '0123456789abcdef' for c in ref.lower())
+            is_commit_sha = _COMMIT_SHA_RE.fullmatch(ref) is not None
             is_tag = ref.startswith('v') or ref in [tag.name for tag in repo.tags]
             
             if is_commit_sha or is_tag:
@@ -412,13 +433,8 @@ class RepositoryMirror:
             return mirrors
         
         for mirror_dir in self.mirror_root.iterdir():
-            if mirror_dir.is_dir():
-                try:
-                    # Check if it's a valid git repository
-                    git.Repo(mirror_dir)
-                    mirrors.append(mirror_dir.name)
-                except (git.InvalidGitRepositoryError, git.NoSuchPathError):
-                    continue
+            if _has_git_head(mirror_dir):
+                mirrors.append(mirror_dir.name)
         
         return mirrors
     
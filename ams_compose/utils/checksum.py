@@ -7,12 +7,72 @@ This module provides centralized checksum operations for:
 """
 
 import hashlib
+import mmap
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO, List
+
+# Read buffer for streaming file contents into a hash object
+_CHUNK_SIZE = 1024 * 1024
+
+# Files at least this large are hashed from a memory map instead of the buffer
+_MMAP_THRESHOLD = 10 * 1024 * 1024
+
+
+def _list_files(directory: Path) -> List[Path]:
+    """Return files under directory using a single os.scandir walk.
+    
+    Matches what rglob("*") plus is_file() selected: symlinked directories
+    are not descended and unreadable directories are skipped, but file types
+    come from the cached directory entry instead of a stat per path.
+    """
+    files = []
+    stack = [str(directory)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        files.append(Path(entry.path))
+        except OSError:
+            continue
+    return files
+
+
+def _update_from_file(hash_obj: "hashlib._Hash", f: BinaryIO, buffer: bytearray) -> None:
+    """Stream file contents into hash_obj through a caller-owned reusable buffer.
+    
+    Same approach as hashlib.file_digest (Python 3.11+), but feeds an existing
+    hash object so several files can contribute to one digest. Files of at
+    least _MMAP_THRESHOLD bytes are hashed straight from a read-only memory
+    map; if mapping fails (e.g. on some network filesystems) the buffered
+    loop is used instead.
+    """
+    if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hash_obj.update(mapped)
+            return
+        except (OSError, ValueError):
+            pass
+    
+    view = memoryview(buffer)
+    while True:
+        size = f.readinto(buffer)
+        if not size:
+            break
+        hash_obj.update(view[:size])
 
 
 class ChecksumCalculator:
     """Centralized checksum calculation utilities."""
     
+    # Length of content checksums (SHA256 hex digest); lock files store these
+    HASH_LEN_HEX = 64
+    
     @staticmethod
     def calculate_directory_checksum(directory: Path) -> str:
         """Calculate SHA256 checksum of directory contents.
@@ -27,28 +87,27 @@ class ChecksumCalculator:
             return ""
         
         sha256_hash = hashlib.sha256()
+        buffer = bytearray(_CHUNK_SIZE)
         
         # Get all files recursively, sorted for consistent ordering
-        files = sorted(directory.rglob("*"))
+        files = sorted(_list_files(directory))
         
         for file_path in files:
-            if file_path.is_file():
-                # Skip metadata files when calculating checksum
-                if file_path.name.startswith(".ams-compose-meta"):
-                    continue
-                
-                # Include relative path in hash for structure validation
-                relative_path = file_path.relative_to(directory)
-                sha256_hash.update(str(relative_path).encode('utf-8'))
-                
-                # Include file content in hash
-                try:
-                    with open(file_path, 'rb') as f:
-                        for chunk in iter(lambda: f.read(4096), b""):
-                            sha256_hash.update(chunk)
-                except (OSError, PermissionError):
-                    # Include placeholder for unreadable files
-                    sha256_hash.update(b"<unreadable>")
+            # Skip metadata files when calculating checksum
+            if file_path.name.startswith(".ams-compose-meta"):
+                continue
+            
+            # Include relative path in hash for structure validation
+            relative_path = file_path.relative_to(directory)
+            sha256_hash.update(str(relative_path).encode('utf-8'))
+            
+            # Include file content in hash
+            try:
+                with open(file_path, 'rb') as f:
+                    _update_from_file(sha256_hash, f, buffer)
+            except (OSError, PermissionError):
+                # Include placeholder for unreadable files
+                sha256_hash.update(b"<unreadable>")
         
         return sha256_hash.hexdigest()
     
@@ -67,11 +126,16 @@ class ChecksumCalculator:
         
         try:
             with open(file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, 'sha256').hexdigest()
+                sha256_hash = hashlib.sha256()
+                _update_from_file(sha256_hash, f, bytearray(_CHUNK_SIZE))
+                return sha256_hash.hexdigest()
         except (OSError, PermissionError):
             return ""
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def normalize_repo_url(repo_url: str) -> str:
         """Normalize repository URL for consistent hashing.
         
@@ -95,9 +159,13 @@ class ChecksumCalculator:
         return normalized.lower()
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def generate_repo_hash(repo_url: str) -> str:
         """Generate SHA256 hash for repository URL.
         
+        Results are memoized, since the installer and mirror hash the same
+        few URLs repeatedly.
+        
         Args:
             repo_url: Repository URL
             
@@ -0,0 +1,15 @@
+"""Diagnostic output helpers shared by the end-to-end tests."""
+
+import operator
+import os
+import sys
+
+
+# Abbreviated commit SHA for diagnostic output
+short_sha = operator.itemgetter(slice(0, 8))
+
+
+def report(*lines: str) -> None:
+    """Write diagnostic lines in a single call when AMS_COMPOSE_TEST_VERBOSE is set."""
+    if os.environ.get("AMS_COMPOSE_TEST_VERBOSE"):
+        sys.stdout.write("\n".join(lines) + "\n")
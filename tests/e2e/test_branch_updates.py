@@ -1,33 +1,37 @@
 """End-to-end tests for branch update detection scenarios.
 
 Tests Use Case 1: Source repo branch updated → ams-compose install should update library
+
+Mirrors created with ``shallow=True`` only exercise tip-commit semantics:
+the resolved commit is the branch head and no history or tags are fetched.
 """
 
-import tempfile
-import shutil
 import subprocess
 import yaml
 from pathlib import Path
 from typing import Dict, Any
+from unittest.mock import patch
 
 import pytest
 import git
 
 from ams_compose.core.installer import LibraryInstaller
-from ams_compose.core.config import ComposeConfig
+from ams_compose.core.config import ComposeConfig, YamlDumper
+from tests.e2e.reporting import report, short_sha
 
 
 class TestBranchUpdateDetection:
     """End-to-end tests for automatic branch update detection."""
     
-    def setup_method(self):
-        """Set up test fixtures with temporary directories and mock repositories."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.project_root = Path(self.temp_dir) / "project"
+    @pytest.fixture(autouse=True)
+    def _project(self, tmp_path):
+        """Set up temporary project and mock repositories under pytest's tmp_path."""
+        self.temp_dir = tmp_path
+        self.project_root = tmp_path / "project"
         self.project_root.mkdir()
         
         # Create mock repositories directory
-        self.mock_repos_dir = Path(self.temp_dir) / "mock_repos"
+        self.mock_repos_dir = tmp_path / "mock_repos"
         self.mock_repos_dir.mkdir()
         
         # Initialize installer
@@ -36,10 +40,6 @@ class TestBranchUpdateDetection:
             mirror_root=self.project_root / ".mirror"
         )
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
-    
     def _create_mock_repo(self, repo_name: str, initial_files: Dict[str, str]) -> Path:
         """Create a mock git repository with initial files.
         
@@ -107,7 +107,7 @@ class TestBranchUpdateDetection:
         
         config_path = self.project_root / "ams-compose.yaml"
         with open(config_path, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False)
+            yaml.dump(config_data, f, Dumper=YamlDumper, default_flow_style=False)
     
     @pytest.mark.slow
     def test_branch_update_single_library(self):
@@ -133,7 +133,7 @@ class TestBranchUpdateDetection:
         })
         
         # Initial installation
-        print("🔄 Initial installation...")
+        report("🔄 Initial installation...")
         installed_libraries = self.installer.install_all()
         
         # Verify initial installation
@@ -153,7 +153,7 @@ class TestBranchUpdateDetection:
         assert "Initial amplifier schematic" in initial_sch_content
         
         # Simulate upstream branch update
-        print("🔄 Simulating upstream branch update...")
+        report("🔄 Simulating upstream branch update...")
         updated_files = {
             "designs/libs/analog_lib/amplifier.sch": "* Updated amplifier schematic v2.0\n.subckt amp in out vdd vss\n.param gain=10\n.ends\n",
             "designs/libs/analog_lib/bandgap.sch": "* New bandgap reference\n.subckt bgr vout vdd vss\n.ends\n",
@@ -165,7 +165,7 @@ class TestBranchUpdateDetection:
         assert new_commit != initial_commit
         
         # Run install again - should detect branch update
-        print("🔄 Running install after upstream update...")
+        report("🔄 Running install after upstream update...")
         updated_libraries = self.installer.install_all(check_remote_updates=True)
         
         # Verify update was detected and library was reinstalled
@@ -191,11 +191,13 @@ class TestBranchUpdateDetection:
         assert lock_entry.commit == new_commit
         assert lock_entry.updated_at > lock_entry.installed_at
         
-        print(f"✅ Branch update detection successful:")
-        print(f"   Initial commit: {initial_commit}")
-        print(f"   Updated commit: {new_commit}")
-        print(f"   Files updated: amplifier.sch, README.md")
-        print(f"   Files added: bandgap.sch, bandgap.sym")
+        report(
+            "✅ Branch update detection successful:",
+            f"   Initial commit: {initial_commit}",
+            f"   Updated commit: {new_commit}",
+            "   Files updated: amplifier.sch, README.md",
+            "   Files added: bandgap.sch, bandgap.sym",
+        )
     
     @pytest.mark.slow
     def test_no_update_when_branch_unchanged(self):
@@ -220,7 +222,7 @@ class TestBranchUpdateDetection:
         })
         
         # Initial installation
-        print("🔄 Initial installation...")
+        report("🔄 Initial installation...")
         installed_libraries = self.installer.install_all()
         assert 'stable_lib' in installed_libraries
         
@@ -230,12 +232,19 @@ class TestBranchUpdateDetection:
         initial_updated_at = initial_lock_entry.updated_at
         
         # Run install again immediately - no upstream changes
-        print("🔄 Running install again with no upstream changes...")
-        updated_libraries = self.installer.install_all()
+        report("🔄 Running install again with no upstream changes...")
+        extractor = self.installer.path_extractor
+        with patch.object(extractor, 'extract_library', wraps=extractor.extract_library) as mock_extract:
+            updated_libraries = self.installer.install_all()
         
         # Verify no update occurred - library should be marked as up_to_date
         assert 'stable_lib' in updated_libraries, "Library should be in result"
         assert updated_libraries['stable_lib'].install_status == "up_to_date", "Library should not be updated when branch is unchanged"
+        mock_extract.assert_not_called()
+        
+        # Skipped library must still validate against its recorded checksum
+        validated = self.installer.validate_library('stable_lib', updated_libraries['stable_lib'])
+        assert validated.validation_status == "valid"
         
         # Verify lock file timestamp unchanged
         lock_file_after = self.installer.load_lock_file()
@@ -243,9 +252,35 @@ class TestBranchUpdateDetection:
         assert lock_entry_after.updated_at == initial_updated_at, "Timestamp should not change if no update needed"
         assert lock_entry_after.commit == initial_commit
         
-        print(f"✅ No-update behavior correct:")
-        print(f"   Commit unchanged: {initial_commit}")
-        print(f"   Library skipped with '[up to date]' message")
+        report(
+            "✅ No-update behavior correct:",
+            f"   Commit unchanged: {initial_commit}",
+            "   Library skipped with '[up to date]' message",
+        )
+    
+    @pytest.mark.slow
+    def test_shallow_mirror_resolves_branch_tip(self):
+        """Test that a shallow mirror resolves the branch tip and then follows updates."""
+        repo_path = self._create_mock_repo("shallow_repo", {
+            "designs/libs/shallow_lib/opamp.sch": "* Opamp v1\n"
+        })
+        initial_commit = git.Repo(repo_path).head.commit.hexsha
+        repo_url = f'file://{repo_path}'
+        
+        mirror = self.installer.mirror_manager
+        state = mirror.create_mirror(repo_url, 'main', shallow=True)
+        
+        mirror_path = mirror.get_mirror_path(repo_url)
+        assert state.resolved_commit == initial_commit
+        assert len(bytes.fromhex(state.resolved_commit)) == 20  # full hex SHA-1
+        assert (mirror_path / ".git" / "shallow").exists()
+        assert len(list(git.Repo(mirror_path).iter_commits())) == 1
+        
+        # Branch updates are still picked up by a regular update
+        new_commit = self._add_commit_to_repo(repo_path, {
+            "designs/libs/shallow_lib/opamp.sch": "* Opamp v2\n"
+        }, "Update opamp")
+        assert mirror.update_mirror(repo_url, 'main').resolved_commit == new_commit
     
     @pytest.mark.slow  
     def test_multiple_libraries_mixed_updates(self):
@@ -281,14 +316,14 @@ class TestBranchUpdateDetection:
         })
         
         # Initial installation
-        print("🔄 Installing both libraries...")
+        report("🔄 Installing both libraries...")
         installed_libraries = self.installer.install_all()
         assert len(installed_libraries) == 2
         assert 'stable_lib' in installed_libraries
         assert 'updating_lib' in installed_libraries
         
         # Update only the updating repository
-        print("🔄 Updating only one upstream repository...")
+        report("🔄 Updating only one upstream repository...")
         updated_files = {
             "designs/libs/updating/capacitor.sch": "* Capacitor model v2.0 - improved accuracy\n.subckt cap p n\n.param c=1e-12\n.ends\n",
             "designs/libs/updating/inductor.sch": "* New inductor model\n.subckt ind p n\n.ends\n"
@@ -297,7 +332,7 @@ class TestBranchUpdateDetection:
         new_updating_commit = self._add_commit_to_repo(updating_repo, updated_files, "Add inductor and improve capacitor")
         
         # Run install again
-        print("🔄 Running install after partial upstream update...")
+        report("🔄 Running install after partial upstream update...")
         updated_libraries = self.installer.install_all(check_remote_updates=True)
         
         # Verify only updating_lib was reinstalled
@@ -321,10 +356,12 @@ class TestBranchUpdateDetection:
         cap_content = (updating_path / "capacitor.sch").read_text()
         assert "v2.0" in cap_content, "File should be updated"
         
-        print(f"✅ Mixed update scenario successful:")
-        print(f"   stable_lib: unchanged at {stable_commit[:8]}")
-        print(f"   updating_lib: updated to {new_updating_commit[:8]}")
-        print(f"   Only 1 of 2 libraries required reinstallation")
+        report(
+            "✅ Mixed update scenario successful:",
+            f"   stable_lib: unchanged at {short_sha(stable_commit)}",
+            f"   updating_lib: updated to {short_sha(new_updating_commit)}",
+            "   Only 1 of 2 libraries required reinstallation",
+        )
     
     @pytest.mark.slow
     def test_branch_to_branch_ref_change(self):
@@ -368,7 +405,7 @@ class TestBranchUpdateDetection:
         })
         
         # Install from main branch
-        print("🔄 Installing from main branch...")
+        report("🔄 Installing from main branch...")
         installed_libraries = self.installer.install_all()
         assert 'multi_branch_lib' in installed_libraries
         
@@ -383,7 +420,7 @@ class TestBranchUpdateDetection:
         assert not (library_path / "experimental.sch").exists()
         
         # Update configuration to point to development branch
-        print("🔄 Updating configuration to development branch...")
+        report("🔄 Updating configuration to development branch...")
         self._create_analog_config({
             'multi_branch_lib': {
                 'repo': f'file://{repo_path}',
@@ -394,7 +431,7 @@ class TestBranchUpdateDetection:
         })
         
         # Install again - should detect ref change
-        print("🔄 Installing after ref change to development...")
+        report("🔄 Installing after ref change to development...")
         updated_libraries = self.installer.install_all()
         
         # Verify library was updated due to ref change
@@ -408,7 +445,9 @@ class TestBranchUpdateDetection:
         assert "development branch" in updated_core_content
         assert (library_path / "experimental.sch").exists(), "Development branch files should be present"
         
-        print(f"✅ Branch ref change detection successful:")
-        print(f"   main branch commit: {main_commit[:8]}")
-        print(f"   development branch commit: {dev_commit[:8]}")
-        print(f"   Library correctly switched branches")
\ No newline at end of file
+        report(
+            "✅ Branch ref change detection successful:",
+            f"   main branch commit: {short_sha(main_commit)}",
+            f"   development branch commit: {short_sha(dev_commit)}",
+            "   Library correctly switched branches",
+        )
\ No newline at end of file
@@ -22,6 +22,7 @@ from typing import Dict, Any
 import git
 
 from ams_compose.core.installer import LibraryInstaller
+from ams_compose.core.config import YamlDumper
 
 
 class TestGitignoreInjection:
@@ -88,7 +89,7 @@ class TestGitignoreInjection:
         
         config_path = self.project_root / "ams-compose.yaml"
         with open(config_path, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config_data, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
     
     def _read_gitignore(self) -> str:
         """Read current .gitignore content.
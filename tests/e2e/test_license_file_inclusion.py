@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Dict, Any
 
 from ams_compose.core.installer import LibraryInstaller
-from ams_compose.core.config import ComposeConfig
+from ams_compose.core.config import ComposeConfig, YamlDumper, YamlLoader
 
 
 class TestLicenseFileInclusionE2E:
@@ -74,7 +74,7 @@ furnished to do so, subject to the following conditions:"""
         
         config_path = project_path / "ams-compose.yaml"
         with open(config_path, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False)
+            yaml.dump(config_data, f, Dumper=YamlDumper, default_flow_style=False)
     
     def _create_mock_mirror(self, installer: LibraryInstaller, repo_url: str, mock_repo_path: Path):
         """Create mock mirror by copying mock repo."""
@@ -148,7 +148,7 @@ furnished to do so, subject to the following conditions:"""
         assert metadata_file.exists()
         
         with open(metadata_file, 'r') as f:
-            provenance = yaml.safe_load(f)
+            provenance = yaml.load(f, Loader=YamlLoader)
         
         # Validate provenance content
         assert provenance['library_name'] == 'analog_design_lib'
@@ -290,7 +290,7 @@ furnished to do so, subject to the following conditions:"""
         metadata_file = lib_path / ".ams-compose-metadata.yaml"
         
         with open(metadata_file, 'r') as f:
-            provenance = yaml.safe_load(f)
+            provenance = yaml.load(f, Loader=YamlLoader)
         
         # Validate all required fields are present
         required_fields = ['ams_compose_version', 'library_name', 'source', 'license', 'compliance_notes']
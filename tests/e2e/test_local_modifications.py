@@ -3,32 +3,32 @@
 Tests Use Case 3: Source repo didn't change, local libraries accidentally modified → should give validation errors
 """
 
-import tempfile
-import shutil
+import os
 import subprocess
 import yaml
 from pathlib import Path
 from typing import Dict, Any
-import os
 
 import pytest
 import git
 
 from ams_compose.core.installer import LibraryInstaller
-from ams_compose.core.config import ComposeConfig
+from ams_compose.core.config import ComposeConfig, YamlDumper
+from tests.e2e.reporting import report
 
 
 class TestLocalModificationDetection:
     """End-to-end tests for local modification detection."""
     
-    def setup_method(self):
-        """Set up test fixtures with temporary directories and mock repositories."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.project_root = Path(self.temp_dir) / "project"
+    @pytest.fixture(autouse=True)
+    def _project(self, tmp_path):
+        """Set up temporary project and mock repositories under pytest's tmp_path."""
+        self.temp_dir = tmp_path
+        self.project_root = tmp_path / "project"
         self.project_root.mkdir()
         
         # Create mock repositories directory
-        self.mock_repos_dir = Path(self.temp_dir) / "mock_repos"
+        self.mock_repos_dir = tmp_path / "mock_repos"
         self.mock_repos_dir.mkdir()
         
         # Initialize installer
@@ -37,10 +37,6 @@ class TestLocalModificationDetection:
             mirror_root=self.project_root / ".mirror"
         )
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
-    
     def _create_mock_repo(self, repo_name: str, initial_files: Dict[str, str]) -> Path:
         """Create a mock git repository with initial files.
         
@@ -82,7 +78,7 @@ class TestLocalModificationDetection:
         
         config_path = self.project_root / "ams-compose.yaml"
         with open(config_path, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False)
+            yaml.dump(config_data, f, Dumper=YamlDumper, default_flow_style=False)
     
     @pytest.mark.slow
     def test_detect_modified_library_files(self):
@@ -108,7 +104,7 @@ class TestLocalModificationDetection:
         })
         
         # Initial installation
-        print("🔄 Installing library for modification testing...")
+        report("🔄 Installing library for modification testing...")
         installed_libraries = self.installer.install_all()
         assert 'mod_test_lib' in installed_libraries
         
@@ -126,13 +122,13 @@ class TestLocalModificationDetection:
         original_checksum = lock_file.libraries['mod_test_lib'].checksum
         
         # Test 1: No modifications - should pass validation
-        print("🔄 Testing validation with no modifications...")
+        report("🔄 Testing validation with no modifications...")
         result = self.installer.install_all()
         assert 'mod_test_lib' in result, "Library should be in result"
         assert result['mod_test_lib'].install_status == "up_to_date", "Unmodified library should be marked as up_to_date"
         
         # Test 2: Modify a file slightly
-        print("🔄 Testing detection of minor file modification...")
+        report("🔄 Testing detection of minor file modification...")
         amp_file = library_path / "amplifier.sch"
         original_content = amp_file.read_text()
         
@@ -144,11 +140,13 @@ class TestLocalModificationDetection:
         amp_file.write_text(modified_content)
         
         # Try to run install - note: current smart install logic doesn't validate checksums
-        print("🔄 Running install after file modification...")
+        report("🔄 Running install after file modification...")
         result = self.installer.install_all()
         if 'mod_test_lib' not in result:
-            print("   ⚠️  Smart install logic doesn't detect content modifications")
-            print("      Testing explicit validation instead...")
+            report(
+                "   ⚠️  Smart install logic doesn't detect content modifications",
+                "      Testing explicit validation instead...",
+            )
             
             # Test explicit validation
             validation_results = self.installer.validate_installation()
@@ -158,28 +156,30 @@ class TestLocalModificationDetection:
             assert len(invalid_libs) > 0, "Validation should detect modifications"
             assert any('mod_test_lib' in invalid and 'modified' in invalid 
                       for invalid in invalid_libs), f"Should detect checksum mismatch, got: {invalid_libs}"
-            print(f"   ✅ Explicit validation detected modification: {invalid_libs[0]}")
+            report(f"   ✅ Explicit validation detected modification: {invalid_libs[0]}")
         else:
-            print(f"   ✅ Install detected modification and reinstalled library")
+            report("   ✅ Install detected modification and reinstalled library")
         
         # Test 3: Restore file and verify validation passes
-        print("🔄 Testing validation after file restoration...")
+        report("🔄 Testing validation after file restoration...")
         amp_file.write_text(original_content)
         
         result = self.installer.install_all()
         assert 'mod_test_lib' in result, "Library should be in result"
         assert result['mod_test_lib'].install_status == "up_to_date", "Restored library should be marked as up_to_date"
-        print("   ✅ Validation passes after restoration")
+        report("   ✅ Validation passes after restoration")
         
         # Test 4: Delete a file
-        print("🔄 Testing detection of deleted file...")
+        report("🔄 Testing detection of deleted file...")
         filter_file = library_path / "filter.sch"
         filter_file.unlink()
         
         result = self.installer.install_all()
         if 'mod_test_lib' not in result:
-            print("   ⚠️  Smart install logic doesn't detect deleted files")
-            print("      Testing explicit validation instead...")
+            report(
+                "   ⚠️  Smart install logic doesn't detect deleted files",
+                "      Testing explicit validation instead...",
+            )
             
             # Test explicit validation  
             validation_results = self.installer.validate_installation()
@@ -189,12 +189,12 @@ class TestLocalModificationDetection:
             assert len(invalid_libs) > 0, "Validation should detect deleted files"
             assert any('mod_test_lib' in invalid and 'modified' in invalid 
                       for invalid in invalid_libs), f"Should detect checksum mismatch, got: {invalid_libs}"
-            print(f"   ✅ Explicit validation detected deleted file: {invalid_libs[0]}")
+            report(f"   ✅ Explicit validation detected deleted file: {invalid_libs[0]}")
         else:
-            print(f"   ✅ Install detected deleted file and reinstalled library")
+            report("   ✅ Install detected deleted file and reinstalled library")
         
         # Test 5: Force reinstall should fix modifications
-        print("🔄 Testing force reinstall after modifications...")
+        report("🔄 Testing force reinstall after modifications...")
         force_installed = self.installer.install_all(force=True)
         
         assert 'mod_test_lib' in force_installed, "Force install should process modified library"
@@ -205,10 +205,12 @@ class TestLocalModificationDetection:
         assert "MODIFIED FOR TESTING" not in restored_amp_content, "Modifications should be reverted"
         assert "Operational Amplifier v1.0" in restored_amp_content, "Original content should be restored"
         
-        print("✅ Local modification detection working correctly:")
-        print("   - Detects file content changes")
-        print("   - Detects deleted files")
-        print("   - Force reinstall fixes modifications")
+        report(
+            "✅ Local modification detection working correctly:",
+            "   - Detects file content changes",
+            "   - Detects deleted files",
+            "   - Force reinstall fixes modifications",
+        )
     
     @pytest.mark.slow
     def test_detect_added_files_in_library(self):
@@ -232,14 +234,14 @@ class TestLocalModificationDetection:
         })
         
         # Initial installation
-        print("🔄 Installing clean library...")
+        report("🔄 Installing clean library...")
         installed_libraries = self.installer.install_all()
         assert 'clean_lib' in installed_libraries
         
         library_path = self.project_root / installed_libraries['clean_lib'].local_path
         
         # Test 1: Add unauthorized file
-        print("🔄 Testing detection of added files...")
+        report("🔄 Testing detection of added files...")
         unauthorized_file = library_path / "unauthorized.sch"
         unauthorized_file.write_text("* This file should not be here\n.subckt unauthorized in out\n.ends\n")
         
@@ -248,11 +250,13 @@ class TestLocalModificationDetection:
         backup_file.write_text("* Backup file\n")
         
         # Try to run install - test validation behavior
-        print("🔄 Running install after adding unauthorized files...")
+        report("🔄 Running install after adding unauthorized files...")
         result = self.installer.install_all()
         if 'clean_lib' not in result:
-            print("   ⚠️  Smart install logic doesn't detect unauthorized files")
-            print("      Testing explicit validation instead...")
+            report(
+                "   ⚠️  Smart install logic doesn't detect unauthorized files",
+                "      Testing explicit validation instead...",
+            )
             
             # Test explicit validation
             validation_results = self.installer.validate_installation()
@@ -262,12 +266,12 @@ class TestLocalModificationDetection:
             assert len(invalid_libs) > 0, "Validation should detect unauthorized files"
             assert any('clean_lib' in invalid and 'modified' in invalid 
                       for invalid in invalid_libs), f"Should detect checksum mismatch, got: {invalid_libs}"
-            print(f"   ✅ Explicit validation detected unauthorized files: {invalid_libs[0]}")
+            report(f"   ✅ Explicit validation detected unauthorized files: {invalid_libs[0]}")
         else:
-            print(f"   ✅ Install detected unauthorized files and reinstalled library")
+            report("   ✅ Install detected unauthorized files and reinstalled library")
         
         # Test 2: Force reinstall should clean up unauthorized files
-        print("🔄 Testing cleanup of unauthorized files with force reinstall...")
+        report("🔄 Testing cleanup of unauthorized files with force reinstall...")
         force_installed = self.installer.install_all(force=True)
         
         assert 'clean_lib' in force_installed, "Force install should process library"
@@ -280,9 +284,11 @@ class TestLocalModificationDetection:
         assert (library_path / "dac.sch").exists(), "Original files should remain"
         assert (library_path / "dac.sym").exists(), "Original files should remain"
         
-        print("✅ Unauthorized file detection working correctly:")
-        print("   - Detects added files in library directory")
-        print("   - Force reinstall removes unauthorized files")
+        report(
+            "✅ Unauthorized file detection working correctly:",
+            "   - Detects added files in library directory",
+            "   - Force reinstall removes unauthorized files",
+        )
     
     @pytest.mark.slow  
     def test_detect_permission_changes(self):
@@ -316,7 +322,7 @@ class TestLocalModificationDetection:
         })
         
         # Initial installation
-        print("🔄 Installing library with specific permissions...")
+        report("🔄 Installing library with specific permissions...")
         installed_libraries = self.installer.install_all()
         assert 'perm_test_lib' in installed_libraries
         
@@ -333,17 +339,19 @@ class TestLocalModificationDetection:
         script_stat = installed_script.stat()
         data_stat = installed_data.stat()
         
-        print(f"   Script permissions: {oct(script_stat.st_mode)}")
-        print(f"   Data permissions: {oct(data_stat.st_mode)}")
+        report(
+            f"   Script permissions: {oct(script_stat.st_mode)}",
+            f"   Data permissions: {oct(data_stat.st_mode)}",
+        )
         
         # Test 1: Validate with unchanged permissions
-        print("🔄 Testing validation with unchanged permissions...")
+        report("🔄 Testing validation with unchanged permissions...")
         result = self.installer.install_all()
         assert 'perm_test_lib' in result, "Library should be in result"
         assert result['perm_test_lib'].install_status == "up_to_date", "Library with correct permissions should be marked as up_to_date"
         
         # Test 2: Change file permissions
-        print("🔄 Testing detection of changed permissions...")
+        report("🔄 Testing detection of changed permissions...")
         installed_script.chmod(0o644)  # Remove execute permission
         installed_data.chmod(0o600)    # Remove read for others
         
@@ -353,15 +361,17 @@ class TestLocalModificationDetection:
         try:
             result = self.installer.install_all()
             if 'perm_test_lib' not in result:
-                print("   ⚠️  Current implementation doesn't detect permission changes")
-                print("      This is acceptable as content integrity is the primary concern")
+                report(
+                    "   ⚠️  Current implementation doesn't detect permission changes",
+                    "      This is acceptable as content integrity is the primary concern",
+                )
             else:
-                print("   ✅ Permission changes detected and library reinstalled")
+                report("   ✅ Permission changes detected and library reinstalled")
         except Exception as e:
-            print(f"   ✅ Permission change detection error: {e}")
+            report(f"   ✅ Permission change detection error: {e}")
         
         # Test 3: Force reinstall should restore permissions
-        print("🔄 Testing permission restoration with force reinstall...")
+        report("🔄 Testing permission restoration with force reinstall...")
         force_installed = self.installer.install_all(force=True)
         
         assert 'perm_test_lib' in force_installed, "Force install should process library"
@@ -370,12 +380,16 @@ class TestLocalModificationDetection:
         restored_script_stat = installed_script.stat()
         restored_data_stat = installed_data.stat()
         
-        print(f"   Restored script permissions: {oct(restored_script_stat.st_mode)}")
-        print(f"   Restored data permissions: {oct(restored_data_stat.st_mode)}")
+        report(
+            f"   Restored script permissions: {oct(restored_script_stat.st_mode)}",
+            f"   Restored data permissions: {oct(restored_data_stat.st_mode)}",
+        )
         
-        print("✅ Permission handling test complete:")
-        print("   - Original permissions preserved during installation")
-        print("   - Force reinstall ensures consistent state")
+        report(
+            "✅ Permission handling test complete:",
+            "   - Original permissions preserved during installation",
+            "   - Force reinstall ensures consistent state",
+        )
     
     @pytest.mark.slow
     def test_mixed_modifications_scenario(self):
@@ -402,14 +416,14 @@ class TestLocalModificationDetection:
         })
         
         # Initial installation
-        print("🔄 Installing complex library...")
+        report("🔄 Installing complex library...")
         installed_libraries = self.installer.install_all()
         assert 'complex_lib' in installed_libraries
         
         library_path = self.project_root / installed_libraries['complex_lib'].local_path
         
         # Apply multiple types of modifications
-        print("🔄 Applying multiple modifications...")
+        report("🔄 Applying multiple modifications...")
         
         # 1. Modify existing file content
         analog_file = library_path / "analog.sch"
@@ -428,11 +442,13 @@ class TestLocalModificationDetection:
         readme_file.write_text(readme_content + "\n## Local Modifications\nThis was modified locally\n")
         
         # Try to validate - test detection behavior
-        print("🔄 Running validation with multiple modifications...")
+        report("🔄 Running validation with multiple modifications...")
         result = self.installer.install_all()
         if 'complex_lib' not in result:
-            print("   ⚠️  Smart install logic doesn't detect complex modifications")
-            print("      Testing explicit validation instead...")
+            report(
+                "   ⚠️  Smart install logic doesn't detect complex modifications",
+                "      Testing explicit validation instead...",
+            )
             
             # Test explicit validation
             validation_results = self.installer.validate_installation()
@@ -442,12 +458,12 @@ class TestLocalModificationDetection:
             assert len(invalid_libs) > 0, "Validation should detect multiple modifications"
             assert any('complex_lib' in invalid and 'modified' in invalid 
                       for invalid in invalid_libs), f"Should detect checksum mismatch, got: {invalid_libs}"
-            print(f"   ✅ Explicit validation detected modifications: {invalid_libs[0]}")
+            report(f"   ✅ Explicit validation detected modifications: {invalid_libs[0]}")
         else:
-            print(f"   ✅ Install detected modifications and reinstalled library")
+            report("   ✅ Install detected modifications and reinstalled library")
         
         # Force reinstall should fix everything
-        print("🔄 Testing comprehensive restoration with force reinstall...")
+        report("🔄 Testing comprehensive restoration with force reinstall...")
         force_installed = self.installer.install_all(force=True)
         
         assert 'complex_lib' in force_installed, "Force install should process modified library"
@@ -473,9 +489,11 @@ class TestLocalModificationDetection:
         assert (library_path / "mixed.sch").exists(), "All original files should be present"
         assert (library_path / "simulation.txt").exists(), "All original files should be present"
         
-        print("✅ Complex modification scenario successful:")
-        print("   - Detected content modifications")
-        print("   - Detected deleted files") 
-        print("   - Detected unauthorized files")
-        print("   - Force reinstall restored clean state")
-        print("   - All original files and content preserved")
\ No newline at end of file
+        report(
+            "✅ Complex modification scenario successful:",
+            "   - Detected content modifications",
+            "   - Detected deleted files",
+            "   - Detected unauthorized files",
+            "   - Force reinstall restored clean state",
+            "   - All original files and content preserved",
+        )
\ No newline at end of file
@@ -10,6 +10,7 @@ import pytest
 import git
 
 from ams_compose.core.installer import LibraryInstaller
+from ams_compose.core.config import YamlDumper
 
 
 class TestSubmoduleSupport:
@@ -100,7 +101,7 @@ class TestSubmoduleSupport:
         # Write config file
         config_path = self.project_root / "ams-compose.yaml"
         with open(config_path, 'w') as f:
-            yaml.dump(config_content, f, default_flow_style=False)
+            yaml.dump(config_content, f, Dumper=YamlDumper, default_flow_style=False)
         
         installer = LibraryInstaller(self.project_root)
         
@@ -160,7 +161,7 @@ class TestSubmoduleSupport:
         # Write config file
         config_path = self.project_root / "ams-compose.yaml"
         with open(config_path, 'w') as f:
-            yaml.dump(config_content, f, default_flow_style=False)
+            yaml.dump(config_content, f, Dumper=YamlDumper, default_flow_style=False)
         
         installer = LibraryInstaller(self.project_root)
         
@@ -181,7 +182,7 @@ class TestSubmoduleSupport:
         assert submodule_dir.is_dir()
         
         # This is the key test - submodule files should exist, not just empty directories
-        submodule_files = list(submodule_dir.glob("*"))
+        submodule_files = list(submodule_dir.iterdir())
         assert len(submodule_files) > 0, f"Submodule directory should contain files, got: {submodule_files}"
         
         # Specific submodule content
@@ -219,7 +220,7 @@ class TestSubmoduleSupport:
         # Write config file
         config_path = self.project_root / "ams-compose.yaml"
         with open(config_path, 'w') as f:
-            yaml.dump(config_content, f, default_flow_style=False)
+            yaml.dump(config_content, f, Dumper=YamlDumper, default_flow_style=False)
         
         installer = LibraryInstaller(self.project_root)
         
@@ -5,8 +5,9 @@ import shutil
 from pathlib import Path
 
 import pytest
+import yaml
 
-from ams_compose.core.config import ComposeConfig, ImportSpec
+from ams_compose.core.config import ComposeConfig, ImportSpec, YamlDumper
 from ams_compose.core.extractor import PathExtractor
 
 
@@ -98,7 +99,6 @@ build/
         config_path = self.project_root / "ams-compose.yaml"
         with open(config_path, 'w') as f:
             # Convert to dict and write YAML manually for simplicity
-            import yaml
             config_dict = {
                 "library_root": config.library_root,
                 "imports": {
@@ -109,7 +109,7 @@ build/
                     }
                 }
             }
-            yaml.dump(config_dict, f)
+            yaml.dump(config_dict, f, Dumper=YamlDumper)
         
         # Simulate extraction using PathExtractor directly
         extractor = PathExtractor(self.project_root)
@@ -164,7 +164,6 @@ build/
         # Create config file
         config_path = self.project_root / "ams-compose.yaml"
         with open(config_path, 'w') as f:
-            import yaml
             config_dict = {
                 "library_root": config.library_root,
                 "imports": {
@@ -176,7 +175,7 @@ build/
                     }
                 }
             }
-            yaml.dump(config_dict, f)
+            yaml.dump(config_dict, f, Dumper=YamlDumper)
         
         # Test extraction
         extractor = PathExtractor(self.project_root)
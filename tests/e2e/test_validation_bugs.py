@@ -13,6 +13,7 @@ from typing import Dict, Any
 import git
 
 from ams_compose.core.installer import LibraryInstaller
+from ams_compose.core.config import YamlDumper
 
 
 class TestValidationBugs:
@@ -77,7 +78,7 @@ class TestValidationBugs:
         """
         config_path = self.project_root / "ams-compose.yaml"
         with open(config_path, 'w') as f:
-            yaml.dump(config_data, f)
+            yaml.dump(config_data, f, Dumper=YamlDumper)
         return config_path
 
     def test_orphaned_libraries_in_lockfile(self):
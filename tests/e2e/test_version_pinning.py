@@ -3,8 +3,6 @@
 Tests Use Case 2: Source repo branch updated, but library has pinned version/commit → shouldn't update library
 """
 
-import tempfile
-import shutil
 import subprocess
 import yaml
 from pathlib import Path
@@ -14,20 +12,22 @@ import pytest
 import git
 
 from ams_compose.core.installer import LibraryInstaller
-from ams_compose.core.config import ComposeConfig
+from ams_compose.core.config import ComposeConfig, YamlDumper
+from tests.e2e.reporting import report, short_sha
 
 
 class TestVersionPinning:
     """End-to-end tests for version pinning behavior."""
     
-    def setup_method(self):
-        """Set up test fixtures with temporary directories and mock repositories."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.project_root = Path(self.temp_dir) / "project"
+    @pytest.fixture(autouse=True)
+    def _project(self, tmp_path):
+        """Set up temporary project and mock repositories under pytest's tmp_path."""
+        self.temp_dir = tmp_path
+        self.project_root = tmp_path / "project"
         self.project_root.mkdir()
         
         # Create mock repositories directory
-        self.mock_repos_dir = Path(self.temp_dir) / "mock_repos"
+        self.mock_repos_dir = tmp_path / "mock_repos"
         self.mock_repos_dir.mkdir()
         
         # Initialize installer
@@ -36,10 +36,6 @@ class TestVersionPinning:
             mirror_root=self.project_root / ".mirror"
         )
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
-    
     def _create_mock_repo(self, repo_name: str, initial_files: Dict[str, str]) -> Path:
         """Create a mock git repository with initial files.
         
@@ -107,7 +103,7 @@ class TestVersionPinning:
         
         config_path = self.project_root / "ams-compose.yaml"
         with open(config_path, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False)
+            yaml.dump(config_data, f, Dumper=YamlDumper, default_flow_style=False)
     
     @pytest.mark.slow
     def test_pinned_commit_ignores_branch_updates(self):
@@ -134,7 +130,7 @@ class TestVersionPinning:
         })
         
         # Initial installation
-        print("🔄 Installing library pinned to specific commit...")
+        report("🔄 Installing library pinned to specific commit...")
         installed_libraries = self.installer.install_all()
         
         # Verify initial installation
@@ -154,7 +150,7 @@ class TestVersionPinning:
         assert "v1.0" in initial_sch_content
         
         # Simulate multiple upstream updates
-        print("🔄 Simulating upstream branch updates...")
+        report("🔄 Simulating upstream branch updates...")
         
         # First update
         updated_files_v2 = {
@@ -177,12 +173,14 @@ class TestVersionPinning:
         
         # Verify commits are different
         assert pinned_commit != v2_commit != v3_commit
-        print(f"   Pinned commit: {pinned_commit[:8]}")
-        print(f"   V2 commit: {v2_commit[:8]}")
-        print(f"   V3 commit: {v3_commit[:8]}")
+        report(
+            f"   Pinned commit: {short_sha(pinned_commit)}",
+            f"   V2 commit: {short_sha(v2_commit)}",
+            f"   V3 commit: {short_sha(v3_commit)}",
+        )
         
         # Run install again - should NOT update due to commit pinning
-        print("🔄 Running install after upstream updates...")
+        report("🔄 Running install after upstream updates...")
         updated_libraries = self.installer.install_all()
         
         # Verify no update occurred
@@ -202,10 +200,12 @@ class TestVersionPinning:
         assert lock_entry.commit == pinned_commit, "Lock file should show pinned commit"
         assert lock_entry.ref == pinned_commit, "Lock file ref should be the pinned commit"
         
-        print(f"✅ Version pinning successful:")
-        print(f"   Library remained at pinned commit: {pinned_commit[:8]}")
-        print(f"   Upstream progressed through: {v2_commit[:8]} → {v3_commit[:8]}")
-        print(f"   Library correctly ignored all upstream changes")
+        report(
+            "✅ Version pinning successful:",
+            f"   Library remained at pinned commit: {short_sha(pinned_commit)}",
+            f"   Upstream progressed through: {short_sha(v2_commit)} → {short_sha(v3_commit)}",
+            "   Library correctly ignored all upstream changes",
+        )
     
     @pytest.mark.slow
     def test_pinned_tag_ignores_branch_updates(self):
@@ -234,7 +234,7 @@ class TestVersionPinning:
         })
         
         # Initial installation
-        print("🔄 Installing library pinned to tag v1.0.0...")
+        report("🔄 Installing library pinned to tag v1.0.0...")
         installed_libraries = self.installer.install_all()
         
         # Verify installation with tag
@@ -271,7 +271,7 @@ class TestVersionPinning:
         assert tag_commit != dev_commit != latest_commit
         
         # Run install again - should stay at tagged version
-        print("🔄 Running install after upstream development...")
+        report("🔄 Running install after upstream development...")
         updated_libraries = self.installer.install_all()
         
         # Verify no update occurred
@@ -290,10 +290,12 @@ class TestVersionPinning:
         assert lock_entry.commit == tag_commit
         assert lock_entry.ref == 'v1.0.0'
         
-        print(f"✅ Tag pinning successful:")
-        print(f"   Library remained at tag v1.0.0 (commit {tag_commit[:8]})")
-        print(f"   Upstream development: {dev_commit[:8]} → {latest_commit[:8]}")
-        print(f"   New tag v2.0.0 created but ignored")
+        report(
+            "✅ Tag pinning successful:",
+            f"   Library remained at tag v1.0.0 (commit {short_sha(tag_commit)})",
+            f"   Upstream development: {short_sha(dev_commit)} → {short_sha(latest_commit)}",
+            "   New tag v2.0.0 created but ignored",
+        )
     
     @pytest.mark.slow
     def test_mixed_pinning_and_tracking(self):
@@ -315,7 +317,7 @@ class TestVersionPinning:
         second_commit = self._add_commit_to_repo(repo_path, updated_files, "Add filter and update circuit")
         
         # Test 1: Install library pinned to first commit
-        print("🔄 Testing pinned version behavior...")
+        report("🔄 Testing pinned version behavior...")
         self._create_analog_config({
             'mixed_lib': {
                 'repo': f'file://{repo_path}',
@@ -337,7 +339,7 @@ class TestVersionPinning:
         assert not (library_path / "filter.sch").exists(), "Should not have newer files"
         
         # Test 2: Change config to track branch (this should trigger update)
-        print("🔄 Testing branch tracking behavior...")
+        report("🔄 Testing branch tracking behavior...")
         self._create_analog_config({
             'mixed_lib': {
                 'repo': f'file://{repo_path}',
@@ -358,7 +360,7 @@ class TestVersionPinning:
         assert (library_path / "filter.sch").exists(), "Should have new files"
         
         # Test 3: Change back to pinned (should downgrade)
-        print("🔄 Testing downgrade to pinned version...")
+        report("🔄 Testing downgrade to pinned version...")
         self._create_analog_config({
             'mixed_lib': {
                 'repo': f'file://{repo_path}',
@@ -378,11 +380,13 @@ class TestVersionPinning:
         assert "v1.0" in final_circuit_content, "Should have original content"
         assert not (library_path / "filter.sch").exists(), "Should not have newer files"
         
-        print(f"✅ Mixed pinning scenario successful:")
-        print(f"   Pinned install: {initial_commit[:8]}")
-        print(f"   Branch tracking: {second_commit[:8]}")
-        print(f"   Downgrade to pinned: {initial_commit[:8]}")
-        print(f"   Configuration changes trigger appropriate updates")
+        report(
+            "✅ Mixed pinning scenario successful:",
+            f"   Pinned install: {short_sha(initial_commit)}",
+            f"   Branch tracking: {short_sha(second_commit)}",
+            f"   Downgrade to pinned: {short_sha(initial_commit)}",
+            "   Configuration changes trigger appropriate updates",
+        )
     
     @pytest.mark.slow
     def test_force_reinstall_pinned_library(self):
@@ -413,7 +417,7 @@ class TestVersionPinning:
         })
         
         # Initial installation
-        print("🔄 Installing library pinned to older commit...")
+        report("🔄 Installing library pinned to older commit...")
         installed_libraries = self.installer.install_all()
         assert 'force_test_lib' in installed_libraries
         
@@ -423,19 +427,19 @@ class TestVersionPinning:
         assert "v1.0" in initial_content
         
         # Modify local file to simulate corruption
-        print("🔄 Simulating local file corruption...")
+        report("🔄 Simulating local file corruption...")
         (library_path / "mixer.sch").write_text("* CORRUPTED FILE\n")
         
         # Regular install should detect corruption but not update to newer commit
-        print("🔄 Running regular install after corruption...")
+        report("🔄 Running regular install after corruption...")
         # Note: Current implementation may not detect file modifications in smart install
         # This is because it only checks if files exist, not their checksums
         # We'll test the force reinstall behavior instead
         result = self.installer.install_all()
-        print(f"   Regular install result: {list(result.keys())}")
+        report(f"   Regular install result: {list(result.keys())}")
         
         # Force reinstall should restore pinned version
-        print("🔄 Running force reinstall...")
+        report("🔄 Running force reinstall...")
         force_installed = self.installer.install_all(['force_test_lib'], force=True)
         
         # Verify force reinstall restored pinned content (not newer version)
@@ -449,7 +453,9 @@ class TestVersionPinning:
         lock_entry = lock_file.libraries['force_test_lib']
         assert lock_entry.commit == pinned_commit, "Force reinstall should maintain pinned commit"
         
-        print(f"✅ Force reinstall of pinned library successful:")
-        print(f"   Maintained pinned commit: {pinned_commit[:8]}")
-        print(f"   Did not update to newer commit: {newer_commit[:8]}")
-        print(f"   Restored original content from pinned version")
\ No newline at end of file
+        report(
+            "✅ Force reinstall of pinned library successful:",
+            f"   Maintained pinned commit: {short_sha(pinned_commit)}",
+            f"   Did not update to newer commit: {short_sha(newer_commit)}",
+            "   Restored original content from pinned version",
+        )
\ No newline at end of file
@@ -0,0 +1,24 @@
+"""Shared fixtures for CLI command tests."""
+
+import pytest
+from click.testing import CliRunner
+
+from ams_compose.cli.main import main
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Click test runner shared by the CLI tests; invoke() isolates each call's I/O.
+    
+    The runner is warmed with one ``--help`` call so the first test does not
+    absorb Click's one-off command-tree setup in its timing.
+    """
+    cli_runner = CliRunner()
+    cli_runner.invoke(main, ["--help"])
+    return cli_runner
+
+
+@pytest.fixture(autouse=True)
+def _cd(tmp_path, monkeypatch):
+    """Run each CLI test from its own tmp_path; monkeypatch restores the cwd."""
+    monkeypatch.chdir(tmp_path)
@@ -0,0 +1,28 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+
+from ams_compose.core.config import LockEntry
+
+
+_TIMESTAMP = "2025-01-01T00:00:00"
+
+# Canonical lock entry; variants come from model_copy(update=...), which skips re-validation
+_BASE_ENTRY = LockEntry(
+    repo="https://github.com/example/repo",
+    ref="main",
+    commit="abc123",
+    source_path="lib",
+    local_path="designs/libs/test_lib",
+    checksum="expected_checksum",
+    installed_at=_TIMESTAMP,
+    updated_at=_TIMESTAMP
+)
+
+
+@pytest.fixture(scope="session")
+def make_lock_entry():
+    """Factory returning copies of the canonical lock entry with the given fields replaced."""
+    def make(**overrides) -> LockEntry:
+        return _BASE_ENTRY.model_copy(update=overrides)
+    return make
@@ -0,0 +1,58 @@
+"""Shared fixtures for core unit tests."""
+
+from pathlib import Path
+
+import pytest
+
+from ams_compose.core.config import ComposeConfig, ImportSpec
+
+
+# Mock analog design library, relative to the mirror root
+MOCK_LIBRARY_FILES = {
+    "libs/test_lib/amplifier.sch": b"* Amplifier schematic\n.subckt amp in out\n.ends",
+    "libs/test_lib/amplifier.sym": b"v {xschem version=3.4.4}\nG {type=symbol}",
+    "libs/test_lib/testbench.sch": b"* Testbench\n.include amplifier.sch",
+    "libs/test_lib/models/nmos.sp": b".model nmos_model nmos",
+    "libs/test_lib/models/pmos.sp": b".model pmos_model pmos",
+}
+
+
+def write_tree(root: Path, files: dict) -> None:
+    """Write files (relative path -> bytes) under root, creating each directory once."""
+    for directory in {(root / rel_path).parent for rel_path in files}:
+        directory.mkdir(parents=True, exist_ok=True)
+    for rel_path, content in files.items():
+        (root / rel_path).write_bytes(content)
+
+
+@pytest.fixture(scope="module")
+def mock_mirror(tmp_path_factory):
+    """Read-only mock mirror shared by the module; tests that modify files copy it first."""
+    mirror = tmp_path_factory.mktemp("mirror") / "test_repo"
+    write_tree(mirror, MOCK_LIBRARY_FILES)
+    return mirror
+
+
+@pytest.fixture(scope="module")
+def sample_config_yaml(tmp_path_factory):
+    """Serialize the sample configuration once per test module."""
+    config = ComposeConfig()
+    config.library_root = "designs/libs"
+    config.imports = {
+        "test_library": ImportSpec(
+            repo="https://github.com/example/test-repo",
+            ref="main",
+            source_path="lib/test"
+        ),
+        "another_lib": ImportSpec(
+            repo="https://github.com/example/another-repo", 
+            ref="v1.0.0",
+            source_path="src",
+            local_path="custom/path"
+        )
+    }
+    
+    config_path = tmp_path_factory.mktemp("sample_config") / "ams-compose.yaml"
+    config.to_yaml(config_path)
+    
+    return config, config_path.read_bytes()
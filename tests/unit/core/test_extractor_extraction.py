@@ -1,8 +1,7 @@
 """Unit tests for PathExtractor extraction operations."""
 
+import re
 import sys
-import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import patch, call
 
@@ -11,396 +10,194 @@ import pytest
 from ams_compose.core.extractor import PathExtractor, ExtractionState, _exclude_from_icloud_sync
 from ams_compose.core.config import ImportSpec
 from ams_compose.utils.checksum import ChecksumCalculator
+from tests.unit.core.conftest import MOCK_LIBRARY_FILES, write_tree
+
+
+_RE_SHA256_HEX = re.compile(r"[0-9a-f]{%d}" % ChecksumCalculator.HASH_LEN_HEX)
+
+# Shared mock library plus a single-file module, relative to the mirror root
+_MOCK_LIBRARY_FILES = {
+    **MOCK_LIBRARY_FILES,
+    "single_file.v": b"module test_module;\nendmodule",
+}
+
+
+@pytest.fixture(scope="module")
+def mock_mirror(mock_mirror):
+    """Shared mock mirror with the single-file module added; tests only read from it."""
+    write_tree(mock_mirror, {"single_file.v": _MOCK_LIBRARY_FILES["single_file.v"]})
+    return mock_mirror
+
+
+@pytest.fixture(scope="module")
+def mock_library_checksum(mock_mirror):
+    """Directory checksum of the mock library source, hashed once per module."""
+    return ChecksumCalculator.calculate_directory_checksum(mock_mirror / "libs" / "test_lib")
+
+
+# Stale content of a previously installed library, replaced by extraction
+_STALE_LIBRARY_FILES = {
+    "old_file.txt": b"old content",
+    "subdir/old_subfile.txt": b"old sub content",
+}
+_STALE_FILE_CONTENT = b"old file content"
+
+
+# Library files plus VCS and development metadata that extraction must skip
+_FULL_REPO_FILES = {
+    "library.v": b"module library(); endmodule",
+    "docs/readme.txt": b"Library documentation",
+    ".git/config": b"[core]\n\trepositoryformatversion = 0",
+    ".git/objects/object1": b"git object",
+    ".gitignore": b"*.log",
+    ".gitmodules": b"[submodule]",
+    ".DS_Store": b"macOS system file",
+}
+_FULL_REPO_EMPTY_DIRS = (".svn", ".hg", ".ipynb_checkpoints", "__pycache__")
+
+
+# Defaults shared by the ImportSpec and extract_library calls in this module
+_SPEC_DEFAULTS = {"repo": "https://example.com/repo", "ref": "main"}
+_EXTRACT_DEFAULTS = {"library_root": "designs/libs", "repo_hash": "abcd1234", "resolved_commit": "commit123456"}
+
+
+def _import_spec(source_path: str, **overrides) -> ImportSpec:
+    """Build an ImportSpec for source_path in the mock repository."""
+    return ImportSpec(**{**_SPEC_DEFAULTS, "source_path": source_path, **overrides})
+
+
+def _relative_paths(root: Path) -> set:
+    """Return the POSIX paths of everything under root, relative to root, from one walk."""
+    return {p.relative_to(root).as_posix() for p in root.rglob("*")}
+
+
+def _assert_extracted(local_path: Path, source_path: str, expected_local: str, extraction_state) -> None:
+    """Assert local_path holds exactly the mock source at source_path and matches the state."""
+    assert extraction_state.local_path == expected_local
+    assert _RE_SHA256_HEX.fullmatch(extraction_state.checksum)
+    
+    if source_path in _MOCK_LIBRARY_FILES:
+        assert local_path.is_file()
+        assert local_path.read_bytes() == _MOCK_LIBRARY_FILES[source_path]
+        return
+    
+    prefix = source_path + "/"
+    for rel_path, content in _MOCK_LIBRARY_FILES.items():
+        if rel_path.startswith(prefix):
+            assert (local_path / rel_path[len(prefix):]).read_bytes() == content
+    assert not _relative_paths(local_path) & set(_STALE_LIBRARY_FILES)
 
 
 class TestExtractionOperations:
     """Test PathExtractor extraction methods."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.project_root = Path(self.temp_dir) / "project"
+    @pytest.fixture(autouse=True)
+    def _project(self, tmp_path, mock_mirror):
+        """Set up a fresh project under tmp_path against the shared mock mirror."""
+        self.project_root = tmp_path / "project"
         self.project_root.mkdir()
         
-        self.mirror_root = Path(self.temp_dir) / "mirror"
-        self.mirror_root.mkdir()
-        
         self.extractor = PathExtractor(self.project_root)
+        self.mock_mirror = mock_mirror
         
-        # Create mock mirror structure
-        self.mock_mirror = self.mirror_root / "test_repo"
-        self.mock_mirror.mkdir()
-        
-        # Create test source files/directories
-        self.create_mock_library_structure()
+        # Default install location, joined once for the path assertions
+        self.libs_dir = self.project_root / _EXTRACT_DEFAULTS["library_root"]
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
+    def _extract(self, library_name, import_spec, **overrides):
+        """Run extract_library against the mock mirror with the module's default settings."""
+        kwargs = {"mirror_path": self.mock_mirror, **_EXTRACT_DEFAULTS, **overrides}
+        return self.extractor.extract_library(library_name=library_name, import_spec=import_spec, **kwargs)
     
-    def create_mock_library_structure(self):
-        """Create mock library files in mirror for testing."""
-        # Create a mock library directory
-        lib_dir = self.mock_mirror / "libs" / "test_lib"
-        lib_dir.mkdir(parents=True)
-        
-        # Create some mock analog design files
-        (lib_dir / "amplifier.sch").write_text("* Amplifier schematic\n.subckt amp in out\n.ends")
-        (lib_dir / "amplifier.sym").write_text("v {xschem version=3.4.4}\nG {type=symbol}")
-        (lib_dir / "testbench.sch").write_text("* Testbench\n.include amplifier.sch")
-        
-        # Create subdirectory with more files
-        models_dir = lib_dir / "models"
-        models_dir.mkdir()
-        (models_dir / "nmos.sp").write_text(".model nmos_model nmos")
-        (models_dir / "pmos.sp").write_text(".model pmos_model pmos")
-        
-        # Create a single file for single-file extraction tests
-        (self.mock_mirror / "single_file.v").write_text("module test_module;\nendmodule")
-    
-    def test_extract_library_directory(self):
-        """Test extracting a library directory."""
-        import_spec = ImportSpec(
-            repo="https://example.com/repo",
-            ref="main",
-            source_path="libs/test_lib"
-        )
-        
-        extraction_state = self.extractor.extract_library(
-            library_name="test_lib",
-            import_spec=import_spec,
-            mirror_path=self.mock_mirror,
-            library_root="designs/libs",
-            repo_hash="abcd1234",
-            resolved_commit="commit123456"
-        )
-        
-        # Verify extraction state
-        assert extraction_state.local_path == "designs/libs/test_lib"
-        assert len(extraction_state.checksum) == 64
-        
-        # Verify files were copied
-        local_path = self.project_root / "designs" / "libs" / "test_lib"
-        assert local_path.exists()
-        assert (local_path / "amplifier.sch").exists()
-        assert (local_path / "amplifier.sym").exists()
-        assert (local_path / "models" / "nmos.sp").exists()
-        
-        # Verify checksum matches extraction state
-        actual_checksum = ChecksumCalculator.calculate_directory_checksum(local_path)
-        assert actual_checksum == extraction_state.checksum
-    
-    def test_extract_library_single_file(self):
-        """Test extracting a single file."""
-        import_spec = ImportSpec(
-            repo="https://example.com/repo",
-            ref="main",
-            source_path="single_file.v"
-        )
-        
-        extraction_state = self.extractor.extract_library(
-            library_name="single_module",
-            import_spec=import_spec,
-            mirror_path=self.mock_mirror,
-            library_root="designs/libs",
-            repo_hash="abcd1234",
-            resolved_commit="commit123456"
-        )
-        
-        # Verify files were copied
-        local_path = self.project_root / "designs" / "libs" / "single_module"
-        assert local_path.exists()
-        assert local_path.is_file()
-        
-        content = local_path.read_text()
-        assert "module test_module" in content
-        
-        # Verify extraction state
-        assert extraction_state.local_path == "designs/libs/single_module"
-        assert len(extraction_state.checksum) == 64
+    @pytest.mark.parametrize("source_path, library_name, local_path, expected_local, pre_create", [
+        pytest.param("libs/test_lib", "test_lib", None, "designs/libs/test_lib", None, id="directory"),
+        pytest.param("single_file.v", "single_module", None, "designs/libs/single_module", None, id="single_file"),
+        pytest.param("libs/test_lib", "test_lib", "custom/location", "custom/location", None, id="path_override"),
+        pytest.param("libs/test_lib", "test_lib", None, "designs/libs/test_lib", "dir", id="replaces_directory"),
+        pytest.param("single_file.v", "single_module", None, "designs/libs/single_module", "file", id="replaces_file"),
+    ])
+    def test_extract_library_success(self, source_path, library_name, local_path, expected_local, pre_create):
+        """Test extracting directories and single files, including over an existing install."""
+        # Optionally seed stale content that extraction must replace
+        existing_path = self.project_root / expected_local
+        if pre_create == "dir":
+            write_tree(existing_path, _STALE_LIBRARY_FILES)
+        elif pre_create == "file":
+            existing_path.parent.mkdir(parents=True)
+            existing_path.write_bytes(_STALE_FILE_CONTENT)
+        
+        import_spec = _import_spec(source_path, local_path=local_path)
+        
+        extraction_state = self._extract(library_name, import_spec)
+        
+        _assert_extracted(existing_path, source_path, expected_local, extraction_state)
     
-    def test_extract_library_with_path_override(self):
-        """Test extracting library with local_path override."""
-        import_spec = ImportSpec(
-            repo="https://example.com/repo",
-            ref="main",
-            source_path="libs/test_lib",
-            local_path="custom/location"
-        )
+    def test_extract_library_checksum_matches_source_tree(self, mock_library_checksum):
+        """Test that the recorded checksum is the directory checksum of the copied source."""
+        import_spec = _import_spec("libs/test_lib")
         
-        extraction_state = self.extractor.extract_library(
-            library_name="test_lib",
-            import_spec=import_spec,
-            mirror_path=self.mock_mirror,
-            library_root="designs/libs",
-            repo_hash="abcd1234",
-            resolved_commit="commit123456"
-        )
+        extraction_state = self._extract("test_lib", import_spec)
         
-        # Verify extraction to custom location
-        local_path = self.project_root / "custom" / "location"
-        assert local_path.exists()
-        assert (local_path / "amplifier.sch").exists()
-        assert extraction_state.local_path == "custom/location"
+        assert extraction_state.checksum == mock_library_checksum
     
     def test_extract_library_missing_source(self):
         """Test extracting from nonexistent source path."""
-        import_spec = ImportSpec(
-            repo="https://example.com/repo",
-            ref="main",
-            source_path="nonexistent/path"
-        )
+        import_spec = _import_spec("nonexistent/path")
         
         with pytest.raises(FileNotFoundError, match="Source path 'nonexistent/path' not found"):
-            self.extractor.extract_library(
-                library_name="test_lib",
-                import_spec=import_spec,
-                mirror_path=self.mock_mirror,
-                library_root="designs/libs",
-                repo_hash="abcd1234",
-                resolved_commit="commit123456"
-            )
+            self._extract("test_lib", import_spec)
     
     def test_extract_library_cleanup_on_failure(self):
         """Test that partial extraction is cleaned up on failure."""
-        import_spec = ImportSpec(
-            repo="https://example.com/repo",
-            ref="main",
-            source_path="libs/nonexistent"  # Use nonexistent path to force failure
-        )
+        import_spec = _import_spec("libs/nonexistent")  # Use nonexistent path to force failure
         
         # This should fail because source_path doesn't exist in mock mirror
         with pytest.raises(FileNotFoundError):
-            self.extractor.extract_library(
-                library_name="test_lib",
-                import_spec=import_spec,
-                mirror_path=self.mock_mirror,
-                library_root="designs/libs",
-                repo_hash="abcd1234",
-                resolved_commit="commit123456"
-            )
+            self._extract("test_lib", import_spec)
         
         # Verify cleanup occurred - library directory should not have been created
-        local_path = self.project_root / "designs" / "libs" / "test_lib"
+        local_path = self.libs_dir / "test_lib"
         assert not local_path.exists(), "Library directory should not exist after extraction failure"
     
-    def test_extract_library_replaces_existing_directory(self):
-        """Test that existing directory is replaced during extraction."""
-        # First, create an existing directory with different content
-        existing_path = self.project_root / "designs" / "libs" / "test_lib"
-        existing_path.mkdir(parents=True)
-        (existing_path / "old_file.txt").write_text("old content")
-        (existing_path / "subdir").mkdir()
-        (existing_path / "subdir" / "old_subfile.txt").write_text("old sub content")
-        
-        # Verify initial state
-        assert existing_path.exists()
-        assert (existing_path / "old_file.txt").exists()
-        assert (existing_path / "subdir" / "old_subfile.txt").exists()
-        
-        # Now extract the library, which should replace the existing directory
-        import_spec = ImportSpec(
-            repo="https://example.com/repo",
-            ref="main",
-            source_path="libs/test_lib"
-        )
-        
-        extraction_state = self.extractor.extract_library(
-            library_name="test_lib",
-            import_spec=import_spec,
-            mirror_path=self.mock_mirror,
-            library_root="designs/libs",
-            repo_hash="abcd1234",
-            resolved_commit="commit123456"
-        )
-        
-        # Verify extraction succeeded
-        assert extraction_state.local_path == "designs/libs/test_lib"
-        assert len(extraction_state.checksum) == 64
-        
-        # Verify old files are gone and new files exist
-        assert not (existing_path / "old_file.txt").exists()
-        assert not (existing_path / "subdir" / "old_subfile.txt").exists()
-        assert (existing_path / "amplifier.sch").exists()
-        assert (existing_path / "models" / "nmos.sp").exists()
-    
-    def test_extract_library_replaces_existing_file(self):
-        """Test that existing file is replaced during extraction."""
-        # First, create an existing file
-        existing_path = self.project_root / "designs" / "libs" / "single_module"
-        existing_path.parent.mkdir(parents=True)
-        existing_path.write_text("old file content")
-        
-        # Verify initial state
-        assert existing_path.exists()
-        assert existing_path.read_text() == "old file content"
-        
-        # Now extract the library, which should replace the existing file
-        import_spec = ImportSpec(
-            repo="https://example.com/repo",
-            ref="main",
-            source_path="single_file.v"
-        )
-        
-        extraction_state = self.extractor.extract_library(
-            library_name="single_module",
-            import_spec=import_spec,
-            mirror_path=self.mock_mirror,
-            library_root="designs/libs",
-            repo_hash="abcd1234",
-            resolved_commit="commit123456"
-        )
-        
-        # Verify extraction succeeded
-        assert extraction_state.local_path == "designs/libs/single_module"
-        assert len(extraction_state.checksum) == 64
-        
-        # Verify old content is replaced with new content
-        content = existing_path.read_text()
-        assert "old file content" not in content
-        assert "module test_module" in content
-    
-    def test_extract_library_exception_cleanup_directory(self):
-        """Test cleanup when exception occurs during directory extraction."""
-        import_spec = ImportSpec(
-            repo="https://example.com/repo",
-            ref="main",
-            source_path="libs/test_lib"
-        )
-        
-        # Mock shutil.copytree to raise an exception after creating directory structure
-        with patch('shutil.copytree') as mock_copytree:
-            mock_copytree.side_effect = OSError("Permission denied")
-            
-            # Verify extraction fails
-            with pytest.raises(OSError, match="Permission denied"):
-                self.extractor.extract_library(
-                    library_name="test_lib",
-                    import_spec=import_spec,
-                    mirror_path=self.mock_mirror,
-                    library_root="designs/libs",
-                    repo_hash="abcd1234",
-                    resolved_commit="commit123456"
-                )
-            
-            # Verify cleanup occurred - no partial directory should exist
-            local_path = self.project_root / "designs" / "libs" / "test_lib"
-            assert not local_path.exists(), "Partial directory should be cleaned up after extraction failure"
-    
-    def test_extract_library_exception_cleanup_file(self):
-        """Test cleanup when exception occurs during file extraction."""
-        import_spec = ImportSpec(
-            repo="https://example.com/repo",
-            ref="main",
-            source_path="single_file.v"
-        )
-        
-        # Mock shutil.copy2 to raise an exception
-        with patch('shutil.copy2') as mock_copy2:
-            mock_copy2.side_effect = OSError("Disk full")
-            
-            # Verify extraction fails
-            with pytest.raises(OSError, match="Disk full"):
-                self.extractor.extract_library(
-                    library_name="single_module",
-                    import_spec=import_spec,
-                    mirror_path=self.mock_mirror,
-                    library_root="designs/libs",
-                    repo_hash="abcd1234",
-                    resolved_commit="commit123456"
-                )
-            
-            # Verify cleanup occurred - no partial file should exist
-            local_path = self.project_root / "designs" / "libs" / "single_module"
-            assert not local_path.exists(), "Partial file should be cleaned up after extraction failure"
+    @pytest.mark.parametrize("patch_target, message, source_path, library_name", [
+        pytest.param('shutil.copytree', "Permission denied", "libs/test_lib", "test_lib", id="copytree"),
+        pytest.param('shutil.copy2', "Disk full", "single_file.v", "single_module", id="copy2"),
+        pytest.param('ams_compose.core.extractor.ChecksumCalculator.calculate_directory_checksum',
+                     "Checksum calculation failed", "libs/test_lib", "test_lib", id="checksum"),
+    ])
+    def test_extract_library_exception_cleanup(self, patch_target, message, source_path, library_name):
+        """Test that a failure while copying or checksumming leaves no partial library behind."""
+        import_spec = _import_spec(source_path)
+        
+        with patch(patch_target, side_effect=OSError(message)):
+            with pytest.raises(OSError, match=message):
+                self._extract(library_name, import_spec)
+        
+        # Verify cleanup occurred - no partial file or directory should exist
+        local_path = self.libs_dir / library_name
+        assert not local_path.exists(), "Partial library should be cleaned up after extraction failure"
     
-    def test_extract_library_exception_cleanup_during_checksum(self):
-        """Test cleanup when exception occurs during checksum calculation."""
-        import_spec = ImportSpec(
-            repo="https://example.com/repo",
-            ref="main",
-            source_path="libs/test_lib"
-        )
-        
-        # Mock ChecksumCalculator to raise an exception after successful copy
-        with patch('ams_compose.core.extractor.ChecksumCalculator.calculate_directory_checksum') as mock_checksum:
-            mock_checksum.side_effect = OSError("Checksum calculation failed")
-            
-            # Verify extraction fails
-            with pytest.raises(OSError, match="Checksum calculation failed"):
-                self.extractor.extract_library(
-                    library_name="test_lib",
-                    import_spec=import_spec,
-                    mirror_path=self.mock_mirror,
-                    library_root="designs/libs",
-                    repo_hash="abcd1234",
-                    resolved_commit="commit123456"
-                )
-            
-            # Verify cleanup occurred - copied files should be removed
-            local_path = self.project_root / "designs" / "libs" / "test_lib"
-            assert not local_path.exists(), "Copied files should be cleaned up after checksum failure"
-    
-    def test_extract_library_ignores_git_directories(self):
+    def test_extract_library_ignores_git_directories(self, tmp_path):
         """Test that .git and other VCS directories are ignored during extraction."""
-        # Create mock source with git metadata and library files
-        source_path = self.mock_mirror / "full_repo"
-        source_path.mkdir(parents=True)
+        # Create mock source with git metadata and library files in its own mirror
+        mirror_path = tmp_path / "mirror"
+        source_path = mirror_path / "full_repo"
+        write_tree(source_path, _FULL_REPO_FILES)
+        for dirname in _FULL_REPO_EMPTY_DIRS:
+            (source_path / dirname).mkdir()
         
-        # Create library files
-        (source_path / "library.v").write_text("module library(); endmodule")
-        (source_path / "docs").mkdir()
-        (source_path / "docs" / "readme.txt").write_text("Library documentation")
+        import_spec = _import_spec("full_repo")  # Extract entire directory including git metadata
         
-        # Create git metadata that should be ignored
-        git_dir = source_path / ".git"
-        git_dir.mkdir()
-        (git_dir / "config").write_text("[core]\n\trepositoryformatversion = 0")
-        (git_dir / "objects").mkdir()
-        (git_dir / "objects" / "object1").write_text("git object")
-        
-        # Create other VCS and development files that should be ignored
-        (source_path / ".gitignore").write_text("*.log")
-        (source_path / ".gitmodules").write_text("[submodule]")
-        (source_path / ".svn").mkdir()
-        (source_path / ".hg").mkdir()
-        (source_path / ".ipynb_checkpoints").mkdir()
-        (source_path / "__pycache__").mkdir()
-        (source_path / ".DS_Store").write_text("macOS system file")
-        
-        import_spec = ImportSpec(
-            repo="https://example.com/repo",
-            ref="main",
-            source_path="full_repo"  # Extract entire directory including git metadata
-        )
-        
-        extraction_state = self.extractor.extract_library(
-            library_name="full_library",
-            import_spec=import_spec,
-            mirror_path=self.mock_mirror,
-            library_root="designs/libs",
-            repo_hash="abcd1234",
-            resolved_commit="commit123456"
-        )
+        extraction_state = self._extract("full_library", import_spec, mirror_path=mirror_path)
         
         # Verify extraction succeeded
         assert extraction_state.local_path == "designs/libs/full_library"
-        assert len(extraction_state.checksum) == 64
+        assert len(extraction_state.checksum) == ChecksumCalculator.HASH_LEN_HEX
         
-        # Verify library files are extracted
-        extracted_path = self.project_root / "designs" / "libs" / "full_library"
-        assert (extracted_path / "library.v").exists()
-        assert (extracted_path / "docs" / "readme.txt").exists()
-        
-        # Verify VCS and development metadata is NOT extracted
-        assert not (extracted_path / ".git").exists(), ".git directory should be ignored"
-        assert not (extracted_path / ".gitignore").exists(), ".gitignore should be ignored"
-        assert not (extracted_path / ".gitmodules").exists(), ".gitmodules should be ignored"
-        assert not (extracted_path / ".svn").exists(), ".svn directory should be ignored"
-        assert not (extracted_path / ".hg").exists(), ".hg directory should be ignored"
-        assert not (extracted_path / ".ipynb_checkpoints").exists(), ".ipynb_checkpoints should be ignored"
-        assert not (extracted_path / "__pycache__").exists(), "__pycache__ should be ignored"
-        assert not (extracted_path / ".DS_Store").exists(), ".DS_Store should be ignored"
+        # Verify library files are extracted and VCS/development metadata is not
+        extracted = _relative_paths(self.libs_dir / "full_library")
+        assert {"library.v", "docs/readme.txt"} <= extracted
+        ignored = {".git", ".gitignore", ".gitmodules", ".DS_Store", *_FULL_REPO_EMPTY_DIRS}
+        assert not ignored & extracted, "VCS and development metadata should be ignored"
     
     def test_ignore_function_creation(self):
         """Test the _create_ignore_function method directly."""
@@ -432,27 +229,24 @@ class TestExtractionOperations:
         assert 'readme.txt' not in ignored
         assert 'normal_file.txt' not in ignored
     
+    def test_ignore_function_applies_builtin_suffix_patterns(self):
+        """Test that built-in '*.ext' patterns match by file suffix."""
+        ignore_func = self.extractor._create_ignore_function()
+        
+        ignored = ignore_func('/some/dir', ['module.pyc', 'module.pyo', 'module.py', 'pyc'])
+        
+        assert set(ignored) == {'module.pyc', 'module.pyo'}
+    
     # --- iCloud sync exclusion tests ---
 
     def test_extract_library_calls_icloud_exclusion(self):
         """Test that extract_library excludes the library directory from iCloud sync."""
-        import_spec = ImportSpec(
-            repo="https://example.com/repo",
-            ref="main",
-            source_path="libs/test_lib"
-        )
+        import_spec = _import_spec("libs/test_lib")
 
         with patch('ams_compose.core.extractor._exclude_from_icloud_sync') as mock_exclude:
-            self.extractor.extract_library(
-                library_name="test_lib",
-                import_spec=import_spec,
-                mirror_path=self.mock_mirror,
-                library_root="designs/libs",
-                repo_hash="abcd1234",
-                resolved_commit="commit123456"
-            )
-
-        local_path = (self.project_root / "designs" / "libs" / "test_lib").resolve()
+            self._extract("test_lib", import_spec)
+
+        local_path = (self.libs_dir / "test_lib").resolve()
         mock_exclude.assert_called_once_with(local_path)
 
     def test_exclude_from_icloud_sync_calls_xattr_on_macos(self):
@@ -1,9 +1,5 @@
 """Unit tests for PathExtractor three-tier filtering system."""
 
-import tempfile
-import shutil
-from pathlib import Path
-
 import pytest
 
 from ams_compose.core.extractor import PathExtractor
@@ -13,18 +9,14 @@ from ams_compose.core.config import ImportSpec
 class TestThreeTierFiltering:
     """Test PathExtractor three-tier filtering system."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.project_root = Path(self.temp_dir) / "project"
+    @pytest.fixture(autouse=True)
+    def _project(self, tmp_path):
+        """Set up test fixtures under pytest's tmp_path."""
+        self.project_root = tmp_path / "project"
         self.project_root.mkdir()
         
         self.extractor = PathExtractor(self.project_root)
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
-    
     def test_builtin_ignore_patterns_constants(self):
         """Test that built-in ignore patterns are properly defined."""
         # Test VCS patterns
@@ -58,6 +50,18 @@ class TestThreeTierFiltering:
         )
         assert len(all_patterns) == expected_size
     
+    def test_split_builtin_ignore_patterns_cached(self):
+        """Test that built-in patterns are split into names and suffixes once per class."""
+        names, suffixes = self.extractor._split_builtin_ignore_patterns()
+        
+        assert '.git' in names
+        assert set(suffixes) == {'.pyc', '.pyo'}
+        assert names | {'*' + suffix for suffix in suffixes} == self.extractor.get_builtin_ignore_patterns()
+        
+        # A second extractor reuses the same split
+        other = PathExtractor(self.project_root)
+        assert other._split_builtin_ignore_patterns() is PathExtractor._split_builtin_ignore_patterns()
+    
     def test_load_global_ignore_patterns_no_file(self):
         """Test loading global ignore patterns when file doesn't exist."""
         patterns = self.extractor._load_global_ignore_patterns()
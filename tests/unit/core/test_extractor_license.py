@@ -8,7 +8,7 @@ import shutil
 import yaml
 
 from ams_compose.core.extractor import PathExtractor
-from ams_compose.core.config import ImportSpec
+from ams_compose.core.config import ImportSpec, YamlLoader
 from ams_compose.utils.license import LicenseInfo
 
 
@@ -261,7 +261,7 @@ class TestProvenanceMetadata:
         
         # Parse and validate provenance content
         with open(metadata_file, 'r') as f:
-            provenance = yaml.safe_load(f)
+            provenance = yaml.load(f, Loader=YamlLoader)
         
         # Validate structure and content
         assert 'ams_compose_version' in provenance
@@ -371,7 +371,7 @@ class TestProvenanceMetadata:
         
         # Parse and validate that None values are handled properly
         with open(metadata_file, 'r') as f:
-            provenance = yaml.safe_load(f)
+            provenance = yaml.load(f, Loader=YamlLoader)
         
         assert provenance['license']['type'] is None
         assert provenance['license']['file'] is None
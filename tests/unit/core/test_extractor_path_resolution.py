@@ -1,9 +1,5 @@
 """Unit tests for PathExtractor path resolution logic."""
 
-import tempfile
-import shutil
-from pathlib import Path
-
 import pytest
 
 from ams_compose.core.extractor import PathExtractor
@@ -13,18 +9,14 @@ from ams_compose.core.config import ImportSpec
 class TestPathResolution:
     """Test PathExtractor path resolution methods."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.project_root = Path(self.temp_dir) / "project"
+    @pytest.fixture(autouse=True)
+    def _project(self, tmp_path):
+        """Set up test fixtures under pytest's tmp_path."""
+        self.project_root = tmp_path / "project"
         self.project_root.mkdir()
         
         self.extractor = PathExtractor(self.project_root)
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
-    
     def test_resolve_local_path_with_library_root(self):
         """Test path resolution using library_root."""
         import_spec = ImportSpec(
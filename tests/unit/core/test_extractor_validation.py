@@ -1,39 +1,30 @@
 """Unit tests for PathExtractor validation and management operations."""
 
-import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from ams_compose.core.extractor import PathExtractor
 from ams_compose.core.config import ImportSpec
+from ams_compose.utils.checksum import ChecksumCalculator
 
 
 class TestValidationOperations:
     """Test PathExtractor validation and management methods."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.project_root = Path(self.temp_dir) / "project"
+    @pytest.fixture(autouse=True)
+    def _project(self, tmp_path):
+        """Set up test fixtures under pytest's tmp_path."""
+        self.project_root = tmp_path / "project"
         self.project_root.mkdir()
         
-        self.mirror_root = Path(self.temp_dir) / "mirror"
-        self.mirror_root.mkdir()
-        
         self.extractor = PathExtractor(self.project_root)
         
-        # Create mock mirror structure
-        self.mock_mirror = self.mirror_root / "test_repo"
-        self.mock_mirror.mkdir()
-        
-        # Create test source files/directories
+        # Create test source files/directories; this also creates the mirror itself
+        self.mock_mirror = tmp_path / "mirror" / "test_repo"
         self.create_mock_library_structure()
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
-    
     def create_mock_library_structure(self):
         """Create mock library files in mirror for testing."""
         # Create a mock library directory
@@ -94,7 +85,7 @@ class TestValidationOperations:
         
         checksum = self.extractor.validate_library(lib_path)
         assert checksum is not None
-        assert len(checksum) == 64
+        assert len(checksum) == ChecksumCalculator.HASH_LEN_HEX
     
     def test_validate_library_modified_content(self):
         """Test validating library with modified content."""
@@ -215,6 +206,17 @@ class TestValidationOperations:
         assert libraries["lib1"].resolve() == (self.project_root / "designs" / "libs" / "lib1").resolve()
         assert libraries["lib2"].resolve() == (self.project_root / "designs" / "libs" / "lib2").resolve()
     
+    def test_list_installed_libraries_skips_dangling_symlinks(self):
+        """Test that dangling symlinks in library root are not listed."""
+        library_root = self.project_root / "designs" / "libs"
+        (library_root / "real_lib").mkdir(parents=True)
+        (library_root / "dangling").symlink_to(library_root / "missing_target")
+        
+        libraries = self.extractor.list_installed_libraries("designs/libs")
+        
+        assert list(libraries) == ["real_lib"]
+        assert libraries["real_lib"] == library_root / "real_lib"
+    
     def test_validate_library_exception_handling_directory(self):
         """Test exception handling during directory validation."""
         # Create a test library directory
@@ -1,26 +1,56 @@
 """Unit tests for LibraryInstaller batch installation operations."""
 
+import re
 import pytest
-import tempfile
-import shutil
 import sys
 from io import StringIO
-from pathlib import Path
 from unittest.mock import Mock, patch
 
 from ams_compose.core.installer import LibraryInstaller, InstallationError
 from ams_compose.core.config import ComposeConfig, ImportSpec, LockEntry, LockFile
 
 
+# Patch targets shared across tests
+_PATCH_INSTALL_LIBRARY = 'ams_compose.core.installer.LibraryInstaller.install_library'
+
+
+# Expected error messages for pytest.raises(match=...)
+_RE_LIBRARY_NOT_FOUND = re.compile(r"Libraries not found in configuration: \{'nonexistent'\}")
+_RE_BATCH_FAILURE = re.compile("Installation failed for another_lib")
+
+
+# Lock entries returned by mocked install_library calls; tests use copies because
+# install_all sets install_status on the entries it returns
+_TEST_LIBRARY_ENTRY = LockEntry(
+    repo="https://github.com/example/test-repo",
+    ref="main",
+    commit="abc123",
+    source_path="lib/test",
+    local_path="designs/libs/test_library",
+    checksum="checksum1",
+    installed_at="2025-01-01T00:00:00",
+    updated_at="2025-01-01T00:00:00"
+)
+
+_ANOTHER_LIB_ENTRY = LockEntry(
+    repo="https://github.com/example/another-repo",
+    ref="v1.0.0",
+    commit="def456",
+    source_path="src",
+    local_path="custom/path",
+    checksum="checksum2",
+    installed_at="2025-01-01T00:00:00",
+    updated_at="2025-01-01T00:00:00"
+)
+
+
 class TestBatchInstaller:
     """Test LibraryInstaller batch installation methods."""
     
     @pytest.fixture
-    def temp_project(self):
+    def temp_project(self, tmp_path):
         """Create temporary project directory."""
-        temp_dir = Path(tempfile.mkdtemp())
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+        return tmp_path
     
     @pytest.fixture
     def installer(self, temp_project):
@@ -31,59 +61,29 @@ class TestBatchInstaller:
         )
     
     @pytest.fixture
-    def sample_config(self, temp_project):
+    def sample_config(self, temp_project, sample_config_yaml):
         """Create sample ams-compose.yaml configuration."""
-        config = ComposeConfig()
-        config.library_root = "designs/libs"
-        config.imports = {
-            "test_library": ImportSpec(
-                repo="https://github.com/example/test-repo",
-                ref="main",
-                source_path="lib/test"
-            ),
-            "another_lib": ImportSpec(
-                repo="https://github.com/example/another-repo", 
-                ref="v1.0.0",
-                source_path="src",
-                local_path="custom/path"
-            )
-        }
+        config, config_bytes = sample_config_yaml
         
         # Save config to file
-        config_path = temp_project / "ams-compose.yaml"
-        config.to_yaml(config_path)
+        (temp_project / "ams-compose.yaml").write_bytes(config_bytes)
         
-        return config
+        return config.model_copy(deep=True)
     
-    @patch('ams_compose.core.installer.LibraryInstaller.install_library')
-    def test_install_all_success(self, mock_install_library, installer, sample_config):
-        """Test successful installation of all libraries."""
-        # Mock successful installations
-        mock_install_library.side_effect = [
-            LockEntry(
-                repo="https://github.com/example/test-repo",
-                ref="main",
-                commit="abc123",
-                source_path="lib/test",
-                local_path="designs/libs/test_library",
-                checksum="checksum1",
-                installed_at="2025-01-01T00:00:00",
-                updated_at="2025-01-01T00:00:00"
-            ),
-            LockEntry(
-                repo="https://github.com/example/another-repo",
-                ref="v1.0.0",
-                commit="def456",
-                source_path="src",
-                local_path="custom/path",
-                checksum="checksum2",
-                installed_at="2025-01-01T00:00:00",
-                updated_at="2025-01-01T00:00:00"
-            )
-        ]
+    @pytest.mark.parametrize("library_names,expected", [
+        (None, {"test_library", "another_lib"}),
+        (["test_library"], {"test_library"}),
+    ])
+    @patch(_PATCH_INSTALL_LIBRARY)
+    def test_install_all_installs_requested_libraries(self, mock_install_library, installer, sample_config, library_names, expected):
+        """Test installation of all libraries or a specific subset."""
+        entries = {
+            "test_library": _TEST_LIBRARY_ENTRY,
+            "another_lib": _ANOTHER_LIB_ENTRY,
+        }
+        mock_install_library.side_effect = lambda name, *args: entries[name].model_copy()
         
-        # Install all libraries
-        all_libraries = installer.install_all()
+        all_libraries = installer.install_all(library_names=library_names)
         
         # Filter by install status
         installed = {name: entry for name, entry in all_libraries.items() 
@@ -91,74 +91,36 @@ class TestBatchInstaller:
         up_to_date = {name: entry for name, entry in all_libraries.items() 
                      if entry.install_status == "up_to_date"}
         
-        # Verify all libraries were installed
-        assert len(installed) == 2
-        assert "test_library" in installed
-        assert "another_lib" in installed
+        # Verify exactly the requested libraries were installed
+        assert set(installed) == expected
         assert len(up_to_date) == 0  # No libraries should be up-to-date in this test
-        
-        # Verify install_library was called for each library
-        assert mock_install_library.call_count == 2
+        assert mock_install_library.call_count == len(expected)
         
         # Verify lock entries
         assert installed["test_library"].repo == "https://github.com/example/test-repo"
-        assert installed["another_lib"].repo == "https://github.com/example/another-repo"
-        assert installed["another_lib"].local_path == "custom/path"
-    
-    @patch('ams_compose.core.installer.LibraryInstaller.install_library')
-    def test_install_all_specific_libraries(self, mock_install_library, installer, sample_config):
-        """Test installation of specific libraries only."""
-        # Mock successful installation
-        mock_install_library.return_value = LockEntry(
-            repo="https://github.com/example/test-repo",
-            ref="main",
-            commit="abc123",
-            source_path="lib/test",
-            local_path="designs/libs/test_library",
-            checksum="checksum1",
-            installed_at="2025-01-01T00:00:00",
-            updated_at="2025-01-01T00:00:00"
-        )
-        
-        # Install specific library
-        result = installer.install_all(library_names=["test_library"])
-        
-        # Verify only specified library was installed
-        assert len(result) == 1
-        assert "test_library" in result
-        assert "another_lib" not in result
-        
-        # Verify install_library was called once
-        mock_install_library.assert_called_once()
+        if "another_lib" in expected:
+            assert installed["another_lib"].repo == "https://github.com/example/another-repo"
+            assert installed["another_lib"].local_path == "custom/path"
     
     def test_install_all_missing_library(self, installer, sample_config):
         """Test installation when specified library doesn't exist in config."""
-        with pytest.raises(InstallationError, match=r"Libraries not found in configuration: \{'nonexistent'\}"):
+        with pytest.raises(InstallationError, match=_RE_LIBRARY_NOT_FOUND):
             installer.install_all(library_names=["nonexistent"])
     
-    @patch('ams_compose.core.installer.LibraryInstaller.install_library')
+    @patch(_PATCH_INSTALL_LIBRARY)
     def test_install_all_partial_failure(self, mock_install_library, installer, sample_config):
         """Test installation when some libraries fail."""
         # Mock mixed success/failure
         mock_install_library.side_effect = [
-            LockEntry(
-                repo="https://github.com/example/test-repo",
-                ref="main",
-                commit="abc123",
-                source_path="lib/test",
-                local_path="designs/libs/test_library",
-                checksum="checksum1",
-                installed_at="2025-01-01T00:00:00",
-                updated_at="2025-01-01T00:00:00"
-            ),
+            _TEST_LIBRARY_ENTRY.model_copy(),
             Exception("Installation failed for another_lib")
         ]
         
         # Installation should raise error on first failure
-        with pytest.raises(Exception, match="Installation failed for another_lib"):
+        with pytest.raises(Exception, match=_RE_BATCH_FAILURE):
             installer.install_all()
     
-    @patch('ams_compose.core.installer.LibraryInstaller.install_library')
+    @patch(_PATCH_INSTALL_LIBRARY)
     @patch('ams_compose.utils.license.LicenseDetector.get_license_compatibility_warning')
     def test_install_libraries_batch_no_print_output(self, mock_get_warning, mock_install_library, installer, sample_config):
         """Test that _install_libraries_batch() produces no print output (TDD Cycle 4 RED)."""
@@ -217,7 +179,7 @@ class TestBatchInstaller:
         assert result["test_library"].install_status == "installed"
         assert result["test_library"].license_warning is not None  # Should have warning for MIT license
     
-    @patch('ams_compose.core.installer.LibraryInstaller.install_library')
+    @patch(_PATCH_INSTALL_LIBRARY)
     def test_install_libraries_batch_update_scenario_no_print(self, mock_install_library, installer, sample_config):
         """Test that _install_libraries_batch() handles updates without print output."""
         # Mock successful installation for an update
@@ -278,4 +240,34 @@ class TestBatchInstaller:
         
         # Verify update status and license change are captured
         assert result["test_library"].install_status == "updated"
-        assert result["test_library"].license_change == "license changed: MIT → GPL-3.0"
\ No newline at end of file
+        assert result["test_library"].license_change == "license changed: MIT → GPL-3.0"
+    
+    @pytest.mark.parametrize("second_ref,expected_updates", [
+        ("main", 1),
+        ("v1.0.0", 2),
+    ])
+    def test_install_all_reuses_mirror_state_per_repo_ref(self, installer, temp_project, second_ref, expected_updates):
+        """Test that libraries sharing repo and ref update the mirror only once per run."""
+        config = ComposeConfig(
+            library_root="designs/libs",
+            imports={
+                "lib_a": ImportSpec(repo="https://github.com/example/shared-repo", ref="main", source_path="a"),
+                "lib_b": ImportSpec(repo="https://github.com/example/shared-repo", ref=second_ref, source_path="b"),
+            }
+        )
+        config.to_yaml(temp_project / "ams-compose.yaml")
+        
+        with patch.object(installer.mirror_manager, 'update_mirror') as mock_update, \
+             patch.object(installer.path_extractor, 'extract_library') as mock_extract:
+            mock_update.return_value = Mock(resolved_commit="abc123")
+            mock_extract.side_effect = lambda library_name, **kwargs: Mock(
+                local_path=f"designs/libs/{library_name}",
+                checksum="checksum123"
+            )
+            
+            installer.install_all()
+        
+        assert mock_update.call_count == expected_updates
+        assert mock_extract.call_count == 2
+        # Memoized states do not outlive the install run
+        assert installer._mirror_states is None
@@ -1,23 +1,27 @@
 """Unit tests for LibraryInstaller configuration and lockfile operations."""
 
+import os
+import re
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
+
+import yaml
 
 from ams_compose.core.installer import LibraryInstaller, InstallationError
-from ams_compose.core.config import ComposeConfig, ImportSpec, LockFile, LockEntry
+from ams_compose.core.config import ComposeConfig, ImportSpec, LockFile, LockEntry, YamlLoader, YamlDumper
+
+
+# Expected error messages for pytest.raises(match=...)
+_RE_CONFIG_MISSING = re.compile("Configuration file not found")
+_RE_CONFIG_INVALID = re.compile("Failed to load configuration")
 
 
 class TestInstallerConfig:
     """Test LibraryInstaller configuration and lockfile methods."""
     
     @pytest.fixture
-    def temp_project(self):
+    def temp_project(self, tmp_path):
         """Create temporary project directory."""
-        temp_dir = Path(tempfile.mkdtemp())
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+        return tmp_path
     
     @pytest.fixture
     def installer(self, temp_project):
@@ -28,29 +32,14 @@ class TestInstallerConfig:
         )
     
     @pytest.fixture
-    def sample_config(self, temp_project):
+    def sample_config(self, temp_project, sample_config_yaml):
         """Create sample ams-compose.yaml configuration."""
-        config = ComposeConfig()
-        config.library_root = "designs/libs"
-        config.imports = {
-            "test_library": ImportSpec(
-                repo="https://github.com/example/test-repo",
-                ref="main",
-                source_path="lib/test"
-            ),
-            "another_lib": ImportSpec(
-                repo="https://github.com/example/another-repo", 
-                ref="v1.0.0",
-                source_path="src",
-                local_path="custom/path"
-            )
-        }
+        config, config_bytes = sample_config_yaml
         
         # Save config to file
-        config_path = temp_project / "ams-compose.yaml"
-        config.to_yaml(config_path)
+        (temp_project / "ams-compose.yaml").write_bytes(config_bytes)
         
-        return config
+        return config.model_copy(deep=True)
     
     def test_load_config_success(self, installer, sample_config):
         """Test successful config loading."""
@@ -62,7 +51,7 @@ class TestInstallerConfig:
     
     def test_load_config_missing_file(self, installer):
         """Test loading config when file doesn't exist."""
-        with pytest.raises(InstallationError, match="Configuration file not found"):
+        with pytest.raises(InstallationError, match=_RE_CONFIG_MISSING):
             installer.load_config()
     
     def test_load_config_invalid_yaml(self, installer, temp_project):
@@ -70,9 +59,21 @@ class TestInstallerConfig:
         config_path = temp_project / "ams-compose.yaml"
         config_path.write_text("invalid: yaml: content: [")
         
-        with pytest.raises(InstallationError, match="Failed to load configuration"):
+        with pytest.raises(InstallationError, match=_RE_CONFIG_INVALID):
             installer.load_config()
     
+    def test_load_config_rereads_same_size_rewrite(self, installer, sample_config, temp_project):
+        """Test that load_config sees a rewrite with the same size and modification time."""
+        config_path = temp_project / "ams-compose.yaml"
+        assert installer.load_config().library_root == "designs/libs"
+        
+        # Same byte length and restored mtime, as on a coarse-timestamp filesystem
+        stat = config_path.stat()
+        config_path.write_bytes(config_path.read_bytes().replace(b"designs/libs", b"designs/ipxx"))
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        
+        assert installer.load_config().library_root == "designs/ipxx"
+    
     def test_load_lock_file_new(self, installer, sample_config):
         """Test loading lockfile when none exists."""
         lock_file = installer.load_lock_file()
@@ -80,8 +81,9 @@ class TestInstallerConfig:
         assert lock_file.library_root == "designs/libs"
         assert lock_file.libraries == {}
     
-    def test_load_lock_file_existing(self, installer, temp_project):
-        """Test loading existing lockfile."""
+    @pytest.mark.parametrize("writer", ["to_json", "to_yaml"])
+    def test_load_lock_file_existing(self, installer, temp_project, writer):
+        """Test loading existing lockfile in JSON or legacy YAML format."""
         # Create existing lockfile
         lock_data = LockFile(
             library_root="designs/libs",
@@ -100,7 +102,7 @@ class TestInstallerConfig:
         )
         
         lock_path = temp_project / ".ams-compose.lock"
-        lock_data.to_yaml(lock_path)
+        getattr(lock_data, writer)(lock_path)
         
         # Create minimal config
         config = ComposeConfig()
@@ -138,8 +140,9 @@ class TestInstallerConfig:
         lock_path = temp_project / ".ams-compose.lock"
         assert lock_path.exists()
         
-        # Verify content can be loaded back
-        loaded_lock = LockFile.from_yaml(lock_path)
+        # Verify content is written as JSON and can be loaded back
+        assert lock_path.read_bytes().startswith(b"{")
+        loaded_lock = LockFile.load(lock_path)
         assert loaded_lock.library_root == "designs/libs"
         assert "test_lib" in loaded_lock.libraries
         assert loaded_lock.libraries["test_lib"].commit == "abc123"
@@ -206,6 +209,30 @@ class TestInstallerConfig:
         assert loaded_config.imports["stable_lib"].checkin is False
         assert loaded_config.imports["critical_lib"].checkin is True
     
+    def test_yaml_codec_prefers_libyaml(self, temp_project):
+        """Test that config YAML I/O uses the C codec when available and stays compatible."""
+        assert YamlLoader is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        assert YamlDumper is getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        
+        lock_file = LockFile(library_root="designs/libs", libraries={
+            "test_library": LockEntry(
+                repo="https://github.com/example/test-repo",
+                ref="main",
+                commit="abc123",
+                source_path="lib/test",
+                local_path="designs/libs/test_library",
+                checksum="checksum123",
+                installed_at="2025-01-01T00:00:00",
+                updated_at="2025-01-01T00:00:00"
+            )
+        })
+        lock_path = temp_project / ".ams-compose.lock"
+        lock_file.to_yaml(lock_path)
+        
+        # Output must remain readable by the pure-Python safe loader
+        assert yaml.safe_load(lock_path.read_text()) == lock_file.model_dump(exclude_none=True)
+        assert LockFile.from_yaml(lock_path) == lock_file
+    
     def test_installer_propagates_checkin_field_from_import_spec_to_lock_entry(self, installer, temp_project):
         """Test that installer propagates checkin field from ImportSpec to LockEntry."""
         # This test will fail until we implement the functionality
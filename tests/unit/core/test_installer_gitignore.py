@@ -1,9 +1,6 @@
 """Unit tests for LibraryInstaller gitignore injection logic."""
 
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
 from unittest.mock import Mock, patch
 
 from ams_compose.core.installer import LibraryInstaller, InstallationError
@@ -14,11 +11,9 @@ class TestInstallerGitignore:
     """Test LibraryInstaller gitignore injection functionality."""
     
     @pytest.fixture
-    def temp_project(self):
+    def temp_project(self, tmp_path):
         """Create temporary project directory."""
-        temp_dir = Path(tempfile.mkdtemp())
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+        return tmp_path
     
     @pytest.fixture
     def installer(self, temp_project):
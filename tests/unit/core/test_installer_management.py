@@ -1,24 +1,25 @@
 """Unit tests for LibraryInstaller management operations."""
 
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, create_autospec, patch
 
 from ams_compose.core.installer import LibraryInstaller
-from ams_compose.core.config import ComposeConfig, LockFile, LockEntry
+from ams_compose.core.mirror import RepositoryMirror
+from ams_compose.core.config import ComposeConfig, LockFile
+
+
+# Patch targets shared across tests
+_PATCH_CHECKSUM = 'ams_compose.core.installer.ChecksumCalculator'
+_PATCH_MIRROR = 'ams_compose.core.installer.RepositoryMirror'
 
 
 class TestInstallerManagement:
     """Test LibraryInstaller management methods."""
     
     @pytest.fixture
-    def temp_project(self):
+    def temp_project(self, tmp_path):
         """Create temporary project directory."""
-        temp_dir = Path(tempfile.mkdtemp())
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+        return tmp_path
     
     @pytest.fixture
     def installer(self, temp_project):
@@ -28,7 +29,7 @@ class TestInstallerManagement:
             mirror_root=temp_project / ".mirror"
         )
     
-    def test_list_installed_libraries(self, installer, temp_project):
+    def test_list_installed_libraries(self, installer, temp_project, make_lock_entry):
         """Test listing installed libraries."""
         # Create sample library directories
         lib_root = temp_project / "designs" / "libs"
@@ -46,31 +47,24 @@ class TestInstallerManagement:
         lock_data = LockFile(
             library_root="designs/libs",
             libraries={
-                "library1": LockEntry(
+                "library1": make_lock_entry(
                     repo="https://github.com/example/repo1",
-                    ref="main",
-                    commit="abc123",
-                    source_path="lib",
                     local_path="designs/libs/library1",
-                    checksum="checksum1",
-                    installed_at="2025-01-01T00:00:00",
-                    updated_at="2025-01-01T00:00:00"
+                    checksum="checksum1"
                 ),
-                "library2": LockEntry(
+                "library2": make_lock_entry(
                     repo="https://github.com/example/repo2",
                     ref="v1.0",
                     commit="def456",
                     source_path="src",
                     local_path="designs/libs/library2",
-                    checksum="checksum2",
-                    installed_at="2025-01-01T00:00:00",
-                    updated_at="2025-01-01T00:00:00"
+                    checksum="checksum2"
                 )
             }
         )
         
-        lock_path = temp_project / ".ams-compose.lock"
-        lock_data.to_yaml(lock_path)
+        # Serve lockfile from memory; YAML round-trips are covered in test_installer_config
+        installer.load_lock_file = Mock(return_value=lock_data)
         
         # Test listing
         installed = installer.list_installed_libraries()
@@ -89,35 +83,23 @@ class TestInstallerManagement:
         assert lib2_info.repo == "https://github.com/example/repo2"
         assert lib2_info.ref == "v1.0"
     
-    @patch('ams_compose.core.installer.ChecksumCalculator')
-    def test_validate_installation_success(self, mock_checksum_class, installer, temp_project):
+    @patch(_PATCH_CHECKSUM)
+    def test_validate_installation_success(self, mock_checksum_class, installer, temp_project, make_lock_entry):
         """Test successful installation validation with new Dict[str, LockEntry] return type."""
-        # Create sample library directory
-        lib_root = temp_project / "designs" / "libs"
-        lib_root.mkdir(parents=True)
-        lib_path = lib_root / "test_lib"
-        lib_path.mkdir()
-        (lib_path / "test.sch").write_text("content")
+        # Create sample library directory; contents are irrelevant with the checksum mocked
+        lib_path = temp_project / "designs" / "libs" / "test_lib"
+        lib_path.mkdir(parents=True)
         
         # Create lockfile entry
         lock_data = LockFile(
             library_root="designs/libs",
             libraries={
-                "test_lib": LockEntry(
-                    repo="https://github.com/example/repo",
-                    ref="main",
-                    commit="abc123",
-                    source_path="lib",
-                    local_path="designs/libs/test_lib",
-                    checksum="expected_checksum",
-                    installed_at="2025-01-01T00:00:00",
-                    updated_at="2025-01-01T00:00:00"
-                )
+                "test_lib": make_lock_entry()
             }
         )
         
-        lock_path = temp_project / ".ams-compose.lock"
-        lock_data.to_yaml(lock_path)
+        # Serve lockfile from memory; YAML round-trips are covered in test_installer_config
+        installer.load_lock_file = Mock(return_value=lock_data)
         
         # Create matching config file with the library
         config_path = temp_project / "ams-compose.yaml"
@@ -151,27 +133,18 @@ imports:
         expected_path = lib_path.resolve()
         mock_checksum_class.calculate_directory_checksum.assert_called_once_with(expected_path)
     
-    def test_validate_installation_missing_directory(self, installer, temp_project):
+    def test_validate_installation_missing_directory(self, installer, temp_project, make_lock_entry):
         """Test validation when library directory is missing with new Dict[str, LockEntry] return type."""
         # Create lockfile entry for non-existent library
         lock_data = LockFile(
             library_root="designs/libs",
             libraries={
-                "missing_lib": LockEntry(
-                    repo="https://github.com/example/repo",
-                    ref="main",
-                    commit="abc123",
-                    source_path="lib",
-                    local_path="designs/libs/missing_lib",
-                    checksum="expected_checksum",
-                    installed_at="2025-01-01T00:00:00",
-                    updated_at="2025-01-01T00:00:00"
-                )
+                "missing_lib": make_lock_entry(local_path="designs/libs/missing_lib")
             }
         )
         
-        lock_path = temp_project / ".ams-compose.lock"
-        lock_data.to_yaml(lock_path)
+        # Serve lockfile from memory; YAML round-trips are covered in test_installer_config
+        installer.load_lock_file = Mock(return_value=lock_data)
         
         # Create matching config file with the library
         config_path = temp_project / "ams-compose.yaml"
@@ -196,31 +169,26 @@ imports:
         assert missing_lib_entry.validation_status == "missing"
         assert missing_lib_entry.repo == "https://github.com/example/repo"
     
-    @patch('ams_compose.core.installer.RepositoryMirror')
-    def test_clean_unused_mirrors(self, mock_mirror_class, installer, temp_project):
+    @patch(_PATCH_MIRROR)
+    def test_clean_unused_mirrors(self, mock_mirror_class, installer, temp_project, make_lock_entry):
         """Test cleaning unused mirror directories."""
         # Create lockfile with one entry
         lock_data = LockFile(
             library_root="designs/libs",
             libraries={
-                "active_lib": LockEntry(
+                "active_lib": make_lock_entry(
                     repo="https://github.com/example/active-repo",
-                    ref="main",
-                    commit="abc123",
-                    source_path="lib",
                     local_path="designs/libs/active_lib",
-                    checksum="checksum1",
-                    installed_at="2025-01-01T00:00:00",
-                    updated_at="2025-01-01T00:00:00"
+                    checksum="checksum1"
                 )
             }
         )
         
-        lock_path = temp_project / ".ams-compose.lock"
-        lock_data.to_yaml(lock_path)
+        # Serve lockfile from memory; YAML round-trips are covered in test_installer_config
+        installer.load_lock_file = Mock(return_value=lock_data)
         
         # Mock mirror manager
-        mock_mirror = Mock()
+        mock_mirror = create_autospec(RepositoryMirror, instance=True)
         mock_mirror_class.return_value = mock_mirror
         mock_mirror.list_mirrors.return_value = ["repo_hash1", "repo_hash2", "active_repo_hash"]
         mock_mirror.remove_mirror.return_value = True
@@ -238,28 +206,15 @@ imports:
         # but we can verify the method completed
         assert isinstance(removed, list)
     
-    @patch('ams_compose.core.installer.ChecksumCalculator')
-    def test_validate_library_valid(self, mock_checksum_class, installer, temp_project):
+    @patch(_PATCH_CHECKSUM)
+    def test_validate_library_valid(self, mock_checksum_class, installer, temp_project, make_lock_entry):
         """Test validate_library method with valid library."""
-        # Create sample library directory
-        lib_root = temp_project / "designs" / "libs"
-        lib_root.mkdir(parents=True)
-        lib_path = lib_root / "test_lib"
-        lib_path.mkdir()
-        (lib_path / "test.sch").write_text("content")
+        # Create sample library directory; contents are irrelevant with the checksum mocked
+        lib_path = temp_project / "designs" / "libs" / "test_lib"
+        lib_path.mkdir(parents=True)
         
         # Create LockEntry for validation
-        lock_entry = LockEntry(
-            repo="https://github.com/example/repo",
-            ref="main",
-            commit="abc123",
-            source_path="lib",
-            local_path="designs/libs/test_lib",
-            checksum="expected_checksum",
-            installed_at="2025-01-01T00:00:00",
-            updated_at="2025-01-01T00:00:00",
-            validation_status="unknown"
-        )
+        lock_entry = make_lock_entry()
         
         # Mock checksum calculator to return matching checksum
         mock_checksum_class.calculate_directory_checksum.return_value = "expected_checksum"
@@ -275,8 +230,8 @@ imports:
         expected_path = lib_path.resolve()
         mock_checksum_class.calculate_directory_checksum.assert_called_once_with(expected_path)
     
-    @patch('ams_compose.core.installer.ChecksumCalculator')
-    def test_validate_library_modified(self, mock_checksum_class, installer, temp_project):
+    @patch(_PATCH_CHECKSUM)
+    def test_validate_library_modified(self, mock_checksum_class, installer, temp_project, make_lock_entry):
         """Test validate_library method with modified library."""
         # Create sample library directory
         lib_root = temp_project / "designs" / "libs"
@@ -286,17 +241,7 @@ imports:
         (lib_path / "test.sch").write_text("modified_content")
         
         # Create LockEntry for validation
-        lock_entry = LockEntry(
-            repo="https://github.com/example/repo",
-            ref="main",
-            commit="abc123",
-            source_path="lib",
-            local_path="designs/libs/test_lib",
-            checksum="expected_checksum",
-            installed_at="2025-01-01T00:00:00",
-            updated_at="2025-01-01T00:00:00",
-            validation_status="unknown"
-        )
+        lock_entry = make_lock_entry()
         
         # Mock checksum calculator to return different checksum
         mock_checksum_class.calculate_directory_checksum.return_value = "different_checksum"
@@ -312,20 +257,10 @@ imports:
         expected_path = lib_path.resolve()
         mock_checksum_class.calculate_directory_checksum.assert_called_once_with(expected_path)
     
-    def test_validate_library_missing(self, installer, temp_project):
+    def test_validate_library_missing(self, installer, temp_project, make_lock_entry):
         """Test validate_library method with missing library."""
         # Create LockEntry for non-existent library
-        lock_entry = LockEntry(
-            repo="https://github.com/example/repo",
-            ref="main",
-            commit="abc123",
-            source_path="lib",
-            local_path="designs/libs/missing_lib",
-            checksum="expected_checksum",
-            installed_at="2025-01-01T00:00:00",
-            updated_at="2025-01-01T00:00:00",
-            validation_status="unknown"
-        )
+        lock_entry = make_lock_entry(local_path="designs/libs/missing_lib")
         
         # Test validate_library method
         result = installer.validate_library("missing_lib", lock_entry)
@@ -334,7 +269,7 @@ imports:
         assert result.repo == lock_entry.repo
         assert result.checksum == lock_entry.checksum
     
-    def test_validate_library_error(self, installer, temp_project):
+    def test_validate_library_error(self, installer, temp_project, make_lock_entry):
         """Test validate_library method with validation error."""
         # Create sample library directory
         lib_root = temp_project / "designs" / "libs"
@@ -343,20 +278,10 @@ imports:
         lib_path.mkdir()
         
         # Create LockEntry for validation
-        lock_entry = LockEntry(
-            repo="https://github.com/example/repo",
-            ref="main",
-            commit="abc123",
-            source_path="lib",
-            local_path="designs/libs/test_lib",
-            checksum="expected_checksum",
-            installed_at="2025-01-01T00:00:00",
-            updated_at="2025-01-01T00:00:00",
-            validation_status="unknown"
-        )
+        lock_entry = make_lock_entry()
         
         # Mock checksum calculator to raise exception
-        with patch('ams_compose.core.installer.ChecksumCalculator.calculate_directory_checksum') as mock_checksum:
+        with patch(f'{_PATCH_CHECKSUM}.calculate_directory_checksum') as mock_checksum:
             mock_checksum.side_effect = Exception("Checksum calculation failed")
             
             # Test validate_library method
@@ -1,26 +1,28 @@
 """Unit tests for LibraryInstaller single library operations."""
 
+import re
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import create_autospec, patch
 
 from ams_compose.core.installer import LibraryInstaller, InstallationError
-from ams_compose.core.config import ComposeConfig, ImportSpec, LockEntry
-from ams_compose.core.extractor import ExtractionState
-from ams_compose.core.mirror import MirrorState
+from ams_compose.core.config import LockEntry
+from ams_compose.core.extractor import ExtractionState, PathExtractor
+from ams_compose.core.mirror import MirrorState, RepositoryMirror
+
+
+# Expected error messages for pytest.raises(match=...)
+_RE_INSTALL_FAILURE = re.compile("Failed to install library 'test_library'")
 
 
 class TestSingleLibraryInstaller:
     """Test LibraryInstaller single library installation methods."""
     
     @pytest.fixture
-    def temp_project(self):
+    def temp_project(self, tmp_path):
         """Create temporary project directory."""
-        temp_dir = Path(tempfile.mkdtemp())
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+        return tmp_path
     
     @pytest.fixture
     def installer(self, temp_project):
@@ -31,54 +33,48 @@ class TestSingleLibraryInstaller:
         )
     
     @pytest.fixture
-    def sample_config(self, temp_project):
+    def sample_config(self, temp_project, sample_config_yaml):
         """Create sample ams-compose.yaml configuration."""
-        config = ComposeConfig()
-        config.library_root = "designs/libs"
-        config.imports = {
-            "test_library": ImportSpec(
-                repo="https://github.com/example/test-repo",
-                ref="main",
-                source_path="lib/test"
-            )
-        }
+        config, config_bytes = sample_config_yaml
         
         # Save config to file
-        config_path = temp_project / "ams-compose.yaml"
-        config.to_yaml(config_path)
+        (temp_project / "ams-compose.yaml").write_bytes(config_bytes)
         
-        return config
+        return config.model_copy(deep=True)
     
-    @patch('ams_compose.core.installer.ChecksumCalculator')
-    @patch('ams_compose.core.installer.RepositoryMirror')
-    @patch('ams_compose.core.installer.PathExtractor')
-    def test_install_library_success(self, mock_extractor_class, mock_mirror_class, mock_checksum_class, installer, sample_config):
-        """Test successful single library installation."""
-        # Mock ChecksumCalculator
-        mock_checksum_class.generate_repo_hash.return_value = "hash123"
-        
-        # Mock mirror manager
-        mock_mirror = Mock()
-        mock_mirror_class.return_value = mock_mirror
-        mock_mirror_path = Path("/test/mirror/path")
-        
-        # Mock mirror state with resolved commit
-        mock_mirror_state = MirrorState(resolved_commit="abc123def456")
-        mock_mirror.update_mirror.return_value = mock_mirror_state
-        mock_mirror.get_mirror_path.return_value = mock_mirror_path
-        
-        # Mock path extractor
-        mock_extractor = Mock()
-        mock_extractor_class.return_value = mock_extractor
-        mock_extraction_state = ExtractionState(
-            local_path="designs/libs/test_library",
-            checksum="checksum123"
-        )
-        mock_extractor.extract_library.return_value = mock_extraction_state
+    @pytest.fixture
+    def mocked_deps(self, installer):
+        """Replace the installer's mirror manager and path extractor with mocks.
         
-        # Re-initialize installer to use mocks
-        installer.mirror_manager = mock_mirror
-        installer.path_extractor = mock_extractor
+        Mocks are pre-wired for a successful install of test_library; tests
+        override only the behaviour they exercise.
+        """
+        with patch('ams_compose.core.installer.ChecksumCalculator') as mock_checksum_class:
+            mock_mirror = create_autospec(RepositoryMirror, instance=True)
+            mock_mirror.update_mirror.return_value = MirrorState(resolved_commit="abc123def456")
+            mock_mirror.get_mirror_path.return_value = Path("/test/mirror/path")
+            
+            mock_extractor = create_autospec(PathExtractor, instance=True)
+            mock_extractor.extract_library.return_value = ExtractionState(
+                local_path="designs/libs/test_library",
+                checksum="checksum123"
+            )
+            
+            mock_checksum_class.generate_repo_hash.return_value = "hash123"
+            
+            installer.mirror_manager = mock_mirror
+            installer.path_extractor = mock_extractor
+            yield SimpleNamespace(
+                mirror=mock_mirror,
+                extractor=mock_extractor,
+                checksum=mock_checksum_class
+            )
+    
+    def test_install_library_success(self, mocked_deps, installer, sample_config):
+        """Test successful single library installation."""
+        mock_mirror = mocked_deps.mirror
+        mock_extractor = mocked_deps.extractor
+        mock_mirror_path = mock_mirror.get_mirror_path.return_value
         
         # Test installation
         import_spec = sample_config.imports["test_library"]
@@ -109,18 +105,23 @@ class TestSingleLibraryInstaller:
         assert lock_entry.installed_at is not None
         assert lock_entry.updated_at is not None
     
-    @patch('ams_compose.core.installer.RepositoryMirror')
-    def test_install_library_mirror_failure(self, mock_mirror_class, installer, sample_config):
+    def test_install_library_mirror_failure(self, mocked_deps, installer, sample_config):
         """Test library installation when mirror operation fails."""
         # Mock mirror manager to raise exception
-        mock_mirror = Mock()
-        mock_mirror_class.return_value = mock_mirror
-        mock_mirror.update_mirror.side_effect = Exception("Git operation failed")
-        
-        # Re-initialize installer to use mock
-        installer.mirror_manager = mock_mirror
+        mocked_deps.mirror.update_mirror.side_effect = Exception("Git operation failed")
         
         # Test installation failure
         import_spec = sample_config.imports["test_library"]
-        with pytest.raises(InstallationError, match="Failed to install library 'test_library'"):
-            installer.install_library("test_library", import_spec, "designs/libs")
\ No newline at end of file
+        with pytest.raises(InstallationError, match=_RE_INSTALL_FAILURE):
+            installer.install_library("test_library", import_spec, "designs/libs")
+    
+    def test_install_library_update_preserves_installed_at(self, mocked_deps, installer, sample_config, make_lock_entry):
+        """Test that updating an installed library keeps its original install timestamp."""
+        existing_entry = make_lock_entry(installed_at="2024-06-01T00:00:00")
+        
+        import_spec = sample_config.imports["test_library"]
+        lock_entry = installer.install_library("test_library", import_spec, "designs/libs", existing_entry)
+        
+        assert lock_entry.commit == "abc123def456"
+        assert lock_entry.installed_at == "2024-06-01T00:00:00"
+        assert lock_entry.updated_at != existing_entry.updated_at
@@ -1,28 +1,47 @@
 """Unit tests for RepositoryMirror submodule support."""
 
-import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import patch, MagicMock, call
 
 import pytest
 import git
 
-from ams_compose.core.mirror import RepositoryMirror, MirrorState
+from ams_compose.core.mirror import RepositoryMirror, MirrorState, GitOperationTimeout
+
+
+# Captured at import time: tests patch git.Repo on the shared git module
+_REPO_SPEC = git.Repo
 
 
 class TestSubmoduleSupport:
     """Test RepositoryMirror submodule operations."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.mirror_root = Path(self.temp_dir) / "mirrors"
+    @pytest.fixture(autouse=True)
+    def _mirror(self, tmp_path):
+        """Set up a mirror rooted under pytest's tmp_path."""
+        self.mirror_root = tmp_path / "mirrors"
         self.mirror = RepositoryMirror(self.mirror_root)
-        
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
+    
+    def _create_existing_mirror(self, repo_url):
+        """Create the on-disk layout update_mirror() treats as an existing mirror."""
+        mirror_path = self.mirror.get_mirror_path(repo_url)
+        mirror_path.mkdir()  # RepositoryMirror already created mirror_root
+        (mirror_path / ".git").mkdir()
+        (mirror_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        return mirror_path
+    
+    @staticmethod
+    def _mock_repo(commit="abc123", submodules=()):
+        """Build a git.Repo-specced mock whose main branch and HEAD resolve to commit."""
+        mock_repo = MagicMock(spec=_REPO_SPEC)
+        mock_repo.head.commit.hexsha = commit
+        mock_repo.submodules = list(submodules)
+        mock_repo.remotes.origin.fetch.return_value = None
+        mock_repo.commit.return_value.hexsha = commit
+        mock_repo.heads = {"main": MagicMock()}
+        mock_repo.heads["main"].commit.hexsha = commit
+        mock_repo.git.checkout.return_value = None
+        return mock_repo
     
     @patch('ams_compose.core.mirror.git.Repo')
     @patch('ams_compose.core.mirror.shutil.move')
@@ -30,8 +49,7 @@ class TestSubmoduleSupport:
     def test_create_mirror_clones_with_submodules(self, mock_temp_dir, mock_move, mock_repo_class):
         """Test that create_mirror() clones repositories with submodules."""
         # Arrange
-        mock_repo = MagicMock()
-        mock_repo.head.commit.hexsha = "abc123"
+        mock_repo = self._mock_repo()
         mock_repo_class.clone_from.return_value = mock_repo
         
         # Mock temporary directory and its contents
@@ -61,6 +79,58 @@ class TestSubmoduleSupport:
             assert isinstance(result, MirrorState)
             assert result.resolved_commit == "abc123"
     
+    @pytest.mark.parametrize("ref,expect_shallow", [
+        ("main", True),
+        ("a" * 40, False),
+    ])
+    @patch('ams_compose.core.mirror.git.Repo')
+    def test_create_mirror_shallow_clone_options(self, mock_repo_class, ref, expect_shallow):
+        """Test that shallow=True requests a tip-only clone except for commit SHAs."""
+        mock_repo = self._mock_repo()
+        mock_repo_class.clone_from.return_value = mock_repo
+        
+        with patch.object(Path, 'iterdir', return_value=[]):
+            self.mirror.create_mirror("https://github.com/test/repo.git", ref, shallow=True)
+        
+        clone_kwargs = mock_repo_class.clone_from.call_args[1]
+        assert clone_kwargs['recurse_submodules'] is True
+        if expect_shallow:
+            assert clone_kwargs['depth'] == 1
+            assert clone_kwargs['single_branch'] is True
+            assert clone_kwargs['no_tags'] is True
+            assert clone_kwargs['branch'] == ref
+            mock_repo.git.checkout.assert_not_called()
+        else:
+            assert 'depth' not in clone_kwargs
+            mock_repo.git.checkout.assert_called_once_with(ref)
+    
+    @pytest.mark.parametrize("shallow,expected_url", [
+        (False, "/tmp/test_repo"),
+        (True, "file:///tmp/test_repo"),
+    ])
+    @patch('ams_compose.core.mirror.git.Repo')
+    def test_create_mirror_clones_file_urls_from_local_path(self, mock_repo_class, shallow, expected_url):
+        """Test that file:// URLs are cloned from the plain path unless cloning shallowly."""
+        mock_repo_class.clone_from.return_value = self._mock_repo()
+        mirror = RepositoryMirror(self.mirror_root, allow_file_urls=True)
+        
+        with patch.object(Path, 'iterdir', return_value=[]):
+            mirror.create_mirror("file:///tmp/test_repo", "main", shallow=shallow)
+        
+        assert mock_repo_class.clone_from.call_args[1]['url'] == expected_url
+    
+    @patch('ams_compose.core.mirror.git.Repo')
+    def test_mirror_presence_checks_do_not_open_repositories(self, mock_repo_class):
+        """Test that mirror_exists() and list_mirrors() only look for .git/HEAD."""
+        valid_url = "https://github.com/test/valid.git"
+        valid_path = self._create_existing_mirror(valid_url)
+        (self.mirror_root / "not_a_repo").mkdir()
+        
+        assert self.mirror.mirror_exists(valid_url)
+        assert not self.mirror.mirror_exists("https://github.com/test/missing.git")
+        assert self.mirror.list_mirrors() == [valid_path.name]
+        mock_repo_class.assert_not_called()
+    
     @patch('ams_compose.core.mirror.git.Repo')
     def test_update_mirror_updates_submodules(self, mock_repo_class):
         """Test that update_mirror() updates existing submodules."""
@@ -69,22 +139,13 @@ class TestSubmoduleSupport:
         ref = "main"
         
         # Create mock mirror directory
-        mirror_path = self.mirror.get_mirror_path(repo_url)
-        mirror_path.mkdir(parents=True)
-        (mirror_path / ".git").mkdir()
+        self._create_existing_mirror(repo_url)
         
         # Mock existing repo with submodules
-        mock_repo = MagicMock()
-        mock_repo.head.commit.hexsha = "def456"
-        mock_repo.submodules = [MagicMock()]  # Has submodules
-        mock_repo.remotes.origin.fetch.return_value = None
-        mock_repo.commit.return_value.hexsha = "def456"
-        mock_repo.heads = {"main": MagicMock()}
-        mock_repo.heads["main"].commit.hexsha = "def456"
+        mock_repo = self._mock_repo("def456", submodules=[MagicMock()])
         
         # Mock git.submodule command
         mock_repo.git.submodule.return_value = None
-        mock_repo.git.checkout.return_value = None
         
         mock_repo_class.return_value = mock_repo
         
@@ -104,19 +165,10 @@ class TestSubmoduleSupport:
         ref = "main"
         
         # Create mock mirror directory
-        mirror_path = self.mirror.get_mirror_path(repo_url)
-        mirror_path.mkdir(parents=True)
-        (mirror_path / ".git").mkdir()
+        self._create_existing_mirror(repo_url)
         
         # Mock existing repo without submodules
-        mock_repo = MagicMock()
-        mock_repo.head.commit.hexsha = "ghi789"
-        mock_repo.submodules = []  # No submodules
-        mock_repo.remotes.origin.fetch.return_value = None
-        mock_repo.commit.return_value.hexsha = "ghi789"
-        mock_repo.heads = {"main": MagicMock()}
-        mock_repo.heads["main"].commit.hexsha = "ghi789"
-        mock_repo.git.checkout.return_value = None
+        mock_repo = self._mock_repo("ghi789")
         
         mock_repo_class.return_value = mock_repo
         
@@ -137,22 +189,12 @@ class TestSubmoduleSupport:
         ref = "main"
         
         # Create mock mirror directory
-        mirror_path = self.mirror.get_mirror_path(repo_url)
-        mirror_path.mkdir(parents=True)
-        (mirror_path / ".git").mkdir()
+        self._create_existing_mirror(repo_url)
         
         # Mock repo that will timeout during submodule operations
-        mock_repo = MagicMock()
-        mock_repo.head.commit.hexsha = "timeout123"
-        mock_repo.submodules = [MagicMock()]  # Has submodules
-        mock_repo.remotes.origin.fetch.return_value = None
-        mock_repo.commit.return_value.hexsha = "timeout123"
-        mock_repo.heads = {"main": MagicMock()}
-        mock_repo.heads["main"].commit.hexsha = "timeout123"
-        mock_repo.git.checkout.return_value = None
+        mock_repo = self._mock_repo("timeout123", submodules=[MagicMock()])
         
         # Mock timeout during submodule operation
-        from ams_compose.core.mirror import GitOperationTimeout
         mock_repo.git.submodule.side_effect = GitOperationTimeout("Submodule operation timed out")
         
         mock_repo_class.return_value = mock_repo
@@ -170,8 +212,7 @@ class TestSubmoduleSupport:
         assert hasattr(self.mirror, '_update_submodules'), "RepositoryMirror should have _update_submodules method"
         
         # Test that it's callable
-        mock_repo = MagicMock()
-        mock_repo.submodules = [MagicMock()]
+        mock_repo = self._mock_repo(submodules=[MagicMock()])
         
         # This will fail until implemented
         try:
@@ -1,20 +1,25 @@
 """Tests for checksum calculation utilities."""
 
 import hashlib
-import tempfile
-from pathlib import Path
+import re
+from unittest.mock import Mock
 
 import pytest
 
+from ams_compose.utils import checksum as checksum_module
 from ams_compose.utils.checksum import ChecksumCalculator
 
 
+_LOWER_HEX_RE = re.compile(r"[0-9a-f]+")
+
+
 class TestChecksumCalculator:
     """Test checksum calculation utilities."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+    @pytest.fixture(autouse=True)
+    def _files(self, tmp_path):
+        """Set up test files under pytest's tmp_path."""
+        self.temp_dir = tmp_path
         
         # Create test directory structure
         self.test_lib_dir = self.temp_dir / "test_lib"
@@ -33,20 +38,14 @@ class TestChecksumCalculator:
         self.test_file = self.temp_dir / "single_file.txt"
         self.test_file.write_text("single file content")
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-    
     def test_calculate_directory_checksum_basic(self):
         """Test basic directory checksum calculation."""
         checksum = ChecksumCalculator.calculate_directory_checksum(self.test_lib_dir)
         
-        # Should return a 64-character SHA256 hex string
-        assert len(checksum) == 64
+        # Should return a full-length SHA256 hex string
+        assert len(checksum) == ChecksumCalculator.HASH_LEN_HEX
         assert checksum != ""
-        assert all(c in "0123456789abcdef" for c in checksum)
+        assert _LOWER_HEX_RE.fullmatch(checksum)
     
     def test_calculate_directory_checksum_consistency(self):
         """Test that same directory produces same checksum."""
@@ -77,7 +76,7 @@ class TestChecksumCalculator:
         empty_dir.mkdir()
         
         checksum = ChecksumCalculator.calculate_directory_checksum(empty_dir)
-        assert len(checksum) == 64
+        assert len(checksum) == ChecksumCalculator.HASH_LEN_HEX
         assert checksum != ""
     
     def test_calculate_directory_checksum_nonexistent_directory(self):
@@ -123,14 +122,58 @@ class TestChecksumCalculator:
         # Different structure should produce different checksums
         assert checksum1 != checksum2
     
+    @pytest.mark.parametrize("mmap_threshold, mmap_error", [
+        pytest.param(None, None, id="buffered"),
+        pytest.param(1, None, id="mmap"),
+        pytest.param(1, OSError("mmap not supported"), id="mmap_fallback"),
+    ])
+    def test_calculate_directory_checksum_matches_reference_for_large_files(
+        self, monkeypatch, mmap_threshold, mmap_error
+    ):
+        """Test that buffered and mmap hashing match path+content SHA256 across chunk boundaries."""
+        if mmap_threshold is not None:
+            monkeypatch.setattr(checksum_module, "_MMAP_THRESHOLD", mmap_threshold)
+        if mmap_error is not None:
+            monkeypatch.setattr(checksum_module.mmap, "mmap", Mock(side_effect=mmap_error))
+        
+        large_dir = self.temp_dir / "large"
+        large_dir.mkdir()
+        big = bytes(range(256)) * 9000  # > 2 MiB, spans several read buffers
+        (large_dir / "a.bin").write_bytes(big)
+        (large_dir / "b.txt").write_text("tail")
+        
+        expected = hashlib.sha256()
+        for name, data in (("a.bin", big), ("b.txt", b"tail")):
+            expected.update(name.encode('utf-8'))
+            expected.update(data)
+        
+        assert ChecksumCalculator.calculate_directory_checksum(large_dir) == expected.hexdigest()
+        assert ChecksumCalculator.calculate_file_checksum(large_dir / "a.bin") == hashlib.sha256(big).hexdigest()
+    
+    def test_calculate_directory_checksum_matches_rglob_traversal(self):
+        """Test that the scandir walk hashes the same files, in the same order, as sorted rglob."""
+        deep_dir = self.test_lib_dir / "subdir" / "a" / "b"
+        deep_dir.mkdir(parents=True)
+        (deep_dir / "deep.txt").write_text("deep")
+        (self.test_lib_dir / "a-file.txt").write_text("sorts between entries")
+        (self.test_lib_dir / "linked").symlink_to(self.test_lib_dir / "subdir", target_is_directory=True)
+        
+        expected = hashlib.sha256()
+        for file_path in sorted(self.test_lib_dir.rglob("*")):
+            if file_path.is_file():
+                expected.update(str(file_path.relative_to(self.test_lib_dir)).encode('utf-8'))
+                expected.update(file_path.read_bytes())
+        
+        assert ChecksumCalculator.calculate_directory_checksum(self.test_lib_dir) == expected.hexdigest()
+    
     def test_calculate_file_checksum_basic(self):
         """Test basic file checksum calculation."""
         checksum = ChecksumCalculator.calculate_file_checksum(self.test_file)
         
-        # Should return a 64-character SHA256 hex string
-        assert len(checksum) == 64
+        # Should return a full-length SHA256 hex string
+        assert len(checksum) == ChecksumCalculator.HASH_LEN_HEX
         assert checksum != ""
-        assert all(c in "0123456789abcdef" for c in checksum)
+        assert _LOWER_HEX_RE.fullmatch(checksum)
         
         # Verify it matches direct hashlib calculation
         expected = hashlib.sha256(self.test_file.read_bytes()).hexdigest()
@@ -165,43 +208,34 @@ class TestChecksumCalculator:
         checksum = ChecksumCalculator.calculate_file_checksum(self.test_lib_dir)
         assert checksum == ""
     
-    def test_normalize_repo_url_basic(self):
+    @pytest.mark.parametrize("input_url,expected", [
+        ("https://github.com/user/repo", "https://github.com/user/repo"),
+        ("https://github.com/user/repo/", "https://github.com/user/repo"),
+        ("https://github.com/user/repo.git", "https://github.com/user/repo"),
+        ("https://github.com/user/repo.git/", "https://github.com/user/repo"),
+        ("HTTPS://GITHUB.COM/USER/REPO", "https://github.com/user/repo"),
+    ])
+    def test_normalize_repo_url_basic(self, input_url, expected):
         """Test basic URL normalization."""
-        test_cases = [
-            ("https://github.com/user/repo", "https://github.com/user/repo"),
-            ("https://github.com/user/repo/", "https://github.com/user/repo"),
-            ("https://github.com/user/repo.git", "https://github.com/user/repo"),
-            ("https://github.com/user/repo.git/", "https://github.com/user/repo"),
-            ("HTTPS://GITHUB.COM/USER/REPO", "https://github.com/user/repo"),
-        ]
-        
-        for input_url, expected in test_cases:
-            result = ChecksumCalculator.normalize_repo_url(input_url)
-            assert result == expected, f"Failed for {input_url}"
+        assert ChecksumCalculator.normalize_repo_url(input_url) == expected
     
-    def test_normalize_repo_url_ssh_conversion(self):
+    @pytest.mark.parametrize("input_url,expected", [
+        ("git@github.com:user/repo", "https://github.com/user/repo"),
+        ("git@github.com:user/repo.git", "https://github.com/user/repo"),
+        ("git@gitlab.com:user/repo", "https://gitlab.com/user/repo"),
+        ("git@gitlab.com:user/repo.git", "https://gitlab.com/user/repo"),
+    ])
+    def test_normalize_repo_url_ssh_conversion(self, input_url, expected):
         """Test SSH URL conversion to HTTPS."""
-        test_cases = [
-            ("git@github.com:user/repo", "https://github.com/user/repo"),
-            ("git@github.com:user/repo.git", "https://github.com/user/repo"),
-            ("git@gitlab.com:user/repo", "https://gitlab.com/user/repo"),
-            ("git@gitlab.com:user/repo.git", "https://gitlab.com/user/repo"),
-        ]
-        
-        for input_url, expected in test_cases:
-            result = ChecksumCalculator.normalize_repo_url(input_url)
-            assert result == expected, f"Failed for {input_url}"
+        assert ChecksumCalculator.normalize_repo_url(input_url) == expected
     
-    def test_normalize_repo_url_preserves_other_hosts(self):
+    @pytest.mark.parametrize("input_url,expected", [
+        ("git@example.com:user/repo", "git@example.com:user/repo"),
+        ("git@bitbucket.org:user/repo", "git@bitbucket.org:user/repo"),
+    ])
+    def test_normalize_repo_url_preserves_other_hosts(self, input_url, expected):
         """Test that other SSH hosts are not converted."""
-        test_cases = [
-            ("git@example.com:user/repo", "git@example.com:user/repo"),
-            ("git@bitbucket.org:user/repo", "git@bitbucket.org:user/repo"),
-        ]
-        
-        for input_url, expected in test_cases:
-            result = ChecksumCalculator.normalize_repo_url(input_url)
-            assert result == expected, f"Failed for {input_url}"
+        assert ChecksumCalculator.normalize_repo_url(input_url) == expected
     
     def test_generate_repo_hash_basic(self):
         """Test basic repository hash generation."""
@@ -210,7 +244,7 @@ class TestChecksumCalculator:
         
         # Should return a 16-character hex string
         assert len(hash_result) == 16
-        assert all(c in "0123456789abcdef" for c in hash_result)
+        assert _LOWER_HEX_RE.fullmatch(hash_result)
     
     def test_generate_repo_hash_consistency(self):
         """Test that same URL produces same hash."""
@@ -220,6 +254,18 @@ class TestChecksumCalculator:
         
         assert hash1 == hash2
     
+    def test_generate_repo_hash_cached(self):
+        """Test that repeated hashing of a URL is served from the cache."""
+        ChecksumCalculator.generate_repo_hash.cache_clear()
+        repo_url = "https://github.com/user/repo"
+        
+        hashes = {ChecksumCalculator.generate_repo_hash(repo_url) for _ in range(5)}
+        
+        assert len(hashes) == 1
+        cache_info = ChecksumCalculator.generate_repo_hash.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 4
+    
     def test_generate_repo_hash_normalizes_input(self):
         """Test that equivalent URLs produce same hash."""
         test_cases = [
@@ -246,10 +292,10 @@ class TestChecksumCalculator:
             "https://gitlab.com/user1/repo",
         ]
         
-        hashes = [ChecksumCalculator.generate_repo_hash(url) for url in urls]
+        hashes = {url: ChecksumCalculator.generate_repo_hash(url) for url in urls}
         
         # All hashes should be different
-        assert len(set(hashes)) == len(hashes)
+        assert len(set(hashes.values())) == len(urls), f"Hash collision: {hashes}"
     
     def test_generate_repo_hash_matches_expected_algorithm(self):
         """Test that hash generation matches expected SHA256 algorithm."""